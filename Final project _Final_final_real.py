@@ -9,6 +9,9 @@ import pygame
 import sys
 import os
 import datetime
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 
@@ -58,6 +61,19 @@ def safe_draw(func):
     return wrapper
 
 
+# Fonts keyed by (path, size), loaded once per process so that
+# components and "Start Over" (which re-runs __init__) share them
+FONTS = {}
+
+
+def get_font(size: int, path: str = None) -> pygame.font.Font:
+    """Return the shared font for (path, size), loading it on first use."""
+    key = (path, size)
+    if key not in FONTS:
+        FONTS[key] = pygame.font.Font(path, size)
+    return FONTS[key]
+
+
 class UIComponent(ABC):
     """
     Abstract base class for UI components.
@@ -80,6 +96,8 @@ class UIComponent(ABC):
             height
         )
         self.visible = True
+        # Set when the look changed and the rect needs repainting
+        self.dirty = True
 
     @abstractmethod
     def draw(self, surface: pygame.Surface) -> None:
@@ -119,7 +137,7 @@ class Button(UIComponent):
         self.hover_color = LIGHT_BLUE
         self.text_color = text_color
         self.hovered = False
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(32)
 
     @safe_draw
     def draw(self, surface: pygame.Surface) -> None:
@@ -158,7 +176,10 @@ class Button(UIComponent):
         Returns True when button is clicked.
         """
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.dirty = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 return True
@@ -187,7 +208,7 @@ class InputBox(UIComponent):
         self.placeholder = placeholder
         self.active = False
         self.numeric_only = numeric_only
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(32)
         self.color_inactive = GRAY
         self.color_active = BLUE
 
@@ -219,6 +240,14 @@ class InputBox(UIComponent):
         
         Returns True when Enter is pressed.
         """
+        old_text, old_active = self.text, self.active
+        result = self.handle_input(event)
+        if self.text != old_text or self.active != old_active:
+            self.dirty = True
+        return result
+
+    def handle_input(self, event: pygame.event.Event) -> bool:
+        """Apply one event to the text and active state."""
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.active = self.rect.collidepoint(event.pos)
             return self.active
@@ -241,17 +270,253 @@ class InputBox(UIComponent):
                         self.text += character
         return False
 
+# Events that only affect components; others (e.g. window
+# exposed) repaint the whole screen
+INPUT_EVENTS = (
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.MOUSEWHEEL
+)
+
+
+class VirtualList(UIComponent):
+    """
+    Scrollable list that only draws and hit-tests visible rows.
+
+    Rows have a fixed height, so which rows are visible and which
+    row is under the mouse are simple arithmetic, whatever the
+    length of the list. Scrolling glides toward its target.
+    """
+
+    def __init__(
+        self,
+        position_x: int,
+        position_y: int,
+        width: int,
+        height: int,
+        row_height: int,
+        draw_row,
+        row_gap: int = 0
+    ) -> None:
+        """draw_row(surface, rect, item) draws one row."""
+        super().__init__(position_x, position_y, width, height)
+        self.row_height = row_height
+        self.row_pitch = row_height + row_gap
+        self.draw_row = draw_row
+        self.items: list = []
+        self.scroll_offset = 0.0
+        self.target_offset = 0.0
+        self.clicked_index: int = None
+
+    def max_offset(self) -> int:
+        content_height = len(self.items) * self.row_pitch
+        return max(0, content_height - self.rect.height)
+
+    def scroll_by(self, pixels: float) -> None:
+        self.target_offset = min(
+            max(self.target_offset + pixels, 0),
+            self.max_offset()
+        )
+
+    def scroll_to_end(self) -> None:
+        self.target_offset = self.max_offset()
+
+    def update(self) -> None:
+        """Move one frame closer to the target offset."""
+        self.target_offset = min(self.target_offset, self.max_offset())
+        if self.scroll_offset == self.target_offset:
+            return
+        step = (self.target_offset - self.scroll_offset) * 0.35
+        if abs(step) < 0.5:
+            self.scroll_offset = self.target_offset
+        else:
+            self.scroll_offset += step
+        self.dirty = True
+
+    def row_rect(self, index: int) -> pygame.Rect:
+        top = (self.rect.y + index * self.row_pitch
+               - int(self.scroll_offset))
+        return pygame.Rect(
+            self.rect.x, top, self.rect.width - 10, self.row_height
+        )
+
+    def index_at(self, position) -> int:
+        """Index of the row at a screen position, or None."""
+        if not self.rect.collidepoint(position):
+            return None
+        offset = (position[1] - self.rect.y
+                  + int(self.scroll_offset))
+        index, within_row = divmod(offset, self.row_pitch)
+        if (within_row >= self.row_height
+                or index >= len(self.items)):
+            return None
+        return index
+
+    @safe_draw
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the visible rows and a scrollbar if needed."""
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect.clip(previous_clip))
+        first = int(self.scroll_offset // self.row_pitch)
+        last = min(
+            len(self.items),
+            int((self.scroll_offset + self.rect.height)
+                // self.row_pitch) + 1
+        )
+        for index in range(first, last):
+            self.draw_row(
+                surface, self.row_rect(index), self.items[index]
+            )
+
+        if self.max_offset():
+            content_height = len(self.items) * self.row_pitch
+            bar_height = max(
+                20, self.rect.height * self.rect.height // content_height
+            )
+            bar_top = self.rect.y + int(
+                (self.rect.height - bar_height)
+                * self.scroll_offset / self.max_offset()
+            )
+            pygame.draw.rect(
+                surface,
+                GRAY,
+                (self.rect.right - 6, bar_top, 6, bar_height),
+                border_radius=3
+            )
+        surface.set_clip(previous_clip)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Scroll on mouse wheel; return True when a row is clicked.
+
+        The clicked row's index is stored in clicked_index.
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            if self.rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll_by(-event.y * 3 * self.row_pitch)
+        elif (event.type == pygame.MOUSEBUTTONDOWN
+                and event.button == 1):
+            self.clicked_index = self.index_at(event.pos)
+            return self.clicked_index is not None
+        return False
+
+
 @contextmanager
 def rendering_context(surface: pygame.Surface,
-        background_color: tuple = WHITE):
-    """Context manager for safe rendering operations."""
+        background_color: tuple = WHITE,
+        dirty_rects: list = None):
+    """
+    Context manager for safe rendering operations.
+
+    With dirty_rects, drawing is clipped to those rects and only
+    they are sent to the display; otherwise the whole screen is
+    repainted and flipped.
+    """
     try:
+        if dirty_rects:
+            surface.set_clip(
+                dirty_rects[0].unionall(dirty_rects[1:])
+            )
         surface.fill(background_color)
         yield surface
-        pygame.display.flip()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
     except Exception as error:
         print(f"Rendering error: {error}")
         raise
+    finally:
+        surface.set_clip(None)
+
+
+class SaveWorker:
+    """
+    Background thread that writes files without blocking the UI loop.
+
+    Results are handed back through poll(), which runs each callback
+    on the main thread.
+    """
+
+    def __init__(self) -> None:
+        self.jobs = queue.Queue()
+        self.done = queue.Queue()
+        self.thread = threading.Thread(target=self.work, daemon=True)
+        self.thread.start()
+
+    def work(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            task, callback = job
+            try:
+                result = task()
+            except Exception as error:
+                print(f"Error in background save: {error}")
+                result = None
+            self.done.put((callback, result))
+
+    def submit(self, task, callback) -> None:
+        """Run task on the worker thread; callback(result) runs in poll()."""
+        self.jobs.put((task, callback))
+
+    def poll(self) -> None:
+        """Run callbacks for every finished task."""
+        while not self.done.empty():
+            callback, result = self.done.get()
+            callback(result)
+
+    def close(self) -> None:
+        """Finish queued tasks and stop the thread."""
+        self.jobs.put(None)
+        self.thread.join()
+        self.poll()
+
+
+class BillIdGenerator:
+    """
+    Unique, sortable bill IDs: time to the microsecond plus a sequence.
+
+    Bills saved within the same second no longer share a filename.
+    After sequence 999 the ID moves on to the next microsecond, so IDs
+    stay fixed-width and in order.
+    """
+
+    MAX_SEQUENCE = 999
+
+    def __init__(self) -> None:
+        self.last_us = 0
+        self.sequence = 0
+
+    def next_id(self) -> str:
+        now_us = time.time_ns() // 1000
+        if now_us > self.last_us:
+            self.last_us = now_us
+            self.sequence = 0
+        elif self.sequence < self.MAX_SEQUENCE:
+            self.sequence += 1
+        else:
+            self.last_us += 1
+            self.sequence = 0
+        seconds, micros = divmod(self.last_us, 1_000_000)
+        stamp = datetime.datetime.fromtimestamp(seconds).strftime(
+            "%Y-%m-%d_%H-%M-%S"
+        )
+        return f"{stamp}-{micros:06d}-{self.sequence:03d}"
+
+
+class ArchiveFolder:
+    """Archive directory that is created once, not checked on every save."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.ready = False
+
+    def file_path(self, filename: str) -> str:
+        if not self.ready:
+            os.makedirs(self.path, exist_ok=True)
+            self.ready = True
+        return os.path.join(self.path, filename)
 
 # ================== Models ===================
 class MenuItem(ABC):
@@ -377,20 +642,31 @@ class BillSplitterApp:
         self.qr_image = pygame.transform.scale(self.qr_image, (250, 250))
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 56)
-        self.header_font = pygame.font.Font(None, 42)
-        self.normal_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(56)
+        self.header_font = get_font(42)
+        self.normal_font = get_font(32)
+        self.small_font = get_font(24)
 
         # Data
         self.dishes: dict[str, Dish] = {}
         self.people: dict[str, Person] = {}
+        # Insertion order, so lists can index rows directly
+        self.dish_names: list[str] = []
+        self.person_names: list[str] = []
         self.current_person_index = 0
         self.selected_dishes: list[str] = []
         self.saved_filename: str = None
+        self.saving = False
+        self.full_redraw = True
+
+        # Start Over re-runs __init__, so keep these across restarts
+        if not hasattr(self, "save_worker"):
+            self.save_worker = SaveWorker()
+            self.bill_ids = BillIdGenerator()
+            self.archive_folder = ArchiveFolder("bills_archive")
 
         self.state = STATE_MENU
-        self.scroll_offset = 0
+        self.dirty_rects: list = []
 
         self.setup_ui()
 
@@ -435,42 +711,72 @@ class BillSplitterApp:
             500, 600, 200, 60, "Quit", RED
         )
 
-    def save_results_to_file(self) -> str:
+        # Scrollable lists; each keeps its own scroll_offset
+        self.dish_list = VirtualList(
+            50, 330, 800, 260, 35, self.draw_dish_entry
+        )
+        self.people_list = VirtualList(
+            50, 330, 800, 260, 35, self.draw_person_entry
+        )
+        self.assign_list = VirtualList(
+            50, 170, 800, 420, 40, self.draw_assign_row, row_gap=10
+        )
+        self.dish_list.items = self.dish_names
+        self.people_list.items = self.person_names
+        self.assign_list.items = self.dish_names
+        self.lists = [
+            self.dish_list, self.people_list, self.assign_list
+        ]
+
+        self.components = [
+            self.dish_name_input, self.dish_price_input,
+            self.person_name_input, self.start_button,
+            self.add_dish_button, self.next_button,
+            self.back_button, self.add_person_button,
+            self.save_button, self.restart_button,
+            self.quit_button
+        ] + self.lists
+
+    def save_results_to_file(self) -> None:
         """
-        Save bill summary to a timestamped file.
-        
-        Returns the filename if successful, None otherwise.
+        Save bill summary to a timestamped file in the background.
+
+        The text is built here; the save worker writes it and
+        on_results_saved switches to the file saved screen.
         """
-        try:
-            # Create bills_archive folder if it doesn't exist
-            archive_folder = "bills_archive"
-            if not os.path.exists(archive_folder):
-                os.makedirs(archive_folder)
-            
-            current_time = datetime.datetime.now()
-            timestamp = current_time.strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"bill_{timestamp}.txt"
-            file_path = os.path.join(archive_folder, filename)
-
-            with open(
-                file_path, "w", encoding="utf-8"
-            ) as file_handle:
-                file_handle.write("===== Bill Summary =====\n")
-                file_handle.write(f"Created: {timestamp}\n\n")
-                for person in self.people.values():
-                    file_handle.write(
-                        f"{person.name}: "
-                        f"THB {person.total:.2f}\n"
-                    )
-                total_bill = sum(dish.price for dish in self.dishes.values())
-                file_handle.write(f"\nTotal Bill: {total_bill:.2f} Baht\n")
-                file_handle.write("=========================\n\n")
+        bill_id = self.bill_ids.next_id()
+        lines = ["===== Bill Summary =====\n", f"Created: {bill_id}\n\n"]
+        for person in self.people.values():
+            lines.append(f"{person.name}: THB {person.total:.2f}\n")
+        total_bill = sum(dish.price for dish in self.dishes.values())
+        lines.append(f"\nTotal Bill: {total_bill:.2f} Baht\n")
+        lines.append("=========================\n\n")
+        text = "".join(lines)
 
-            print(f"Bill saved to {file_path}")
-            return file_path
-        except Exception as error:
-            print(f"Error saving bill: {error}")
-            return None
+        archive_folder = self.archive_folder
+        filename = f"bill_{bill_id}.txt"
+
+        def write_file() -> str:
+            try:
+                file_path = archive_folder.file_path(filename)
+                with open(
+                    file_path, "x", encoding="utf-8"
+                ) as file_handle:
+                    file_handle.write(text)
+                print(f"Bill saved to {file_path}")
+                return file_path
+            except Exception as error:
+                print(f"Error saving bill: {error}")
+                return None
+
+        self.saving = True
+        self.save_worker.submit(write_file, self.on_results_saved)
+
+    def on_results_saved(self, file_path: str) -> None:
+        """Show the file saved screen once the write has finished."""
+        self.saving = False
+        self.saved_filename = file_path
+        self.state = STATE_FILE_SAVED
 
     @safe_draw
     def draw_menu_screen(self) -> None:
@@ -528,15 +834,7 @@ class BillSplitterApp:
         )
         self.screen.blit(dishes_header, (50, vertical_position))
 
-        vertical_position += 50
-        for dish in list(self.dishes.values())[:8]:
-            dish_text = self.small_font.render(
-                f"• {dish.get_info()}",
-                True,
-                BLACK
-            )
-            self.screen.blit(dish_text, (70, vertical_position))
-            vertical_position += 35
+        self.dish_list.draw(self.screen)
 
         self.next_button.draw(self.screen)
         self.back_button.draw(self.screen)
@@ -567,15 +865,7 @@ class BillSplitterApp:
         )
         self.screen.blit(people_header, (50, vertical_position))
 
-        vertical_position += 50
-        for person in list(self.people.values())[:10]:
-            person_text = self.small_font.render(
-                f"• {person.name}",
-                True,
-                BLACK
-            )
-            self.screen.blit(person_text, (70, vertical_position))
-            vertical_position += 35
+        self.people_list.draw(self.screen)
 
         self.next_button.draw(self.screen)
         self.back_button.draw(self.screen)
@@ -603,42 +893,7 @@ class BillSplitterApp:
         )
         self.screen.blit(header, (50, 50))
 
-        vertical_position = 170
-        self.dish_rects = {}
-        for dish in list(self.dishes.values()):
-            dish_rect = pygame.Rect(50, vertical_position, 800, 40)
-            self.dish_rects[dish.name] = dish_rect
-
-            is_selected = (dish.name in self.selected_dishes)
-            rect_color = (LIGHT_BLUE if is_selected else LIGHT_GRAY)
-
-            pygame.draw.rect(
-                self.screen,
-                rect_color,
-                dish_rect,
-                border_radius=5
-            )
-            pygame.draw.rect(
-                self.screen,
-                DARK_GRAY,
-                dish_rect,
-                2,
-                border_radius=5
-            )
-
-            selection_indicator = (
-                "(selected) " if is_selected else "  "
-            )
-            text = self.normal_font.render(
-                selection_indicator + dish.get_info(),
-                True,
-                BLACK
-            )
-            self.screen.blit(
-                text,
-                (60, vertical_position + 5)
-            )
-            vertical_position += 50
+        self.assign_list.draw(self.screen)
 
         is_last_person = (
             self.current_person_index >= len(self.people) - 1
@@ -649,6 +904,53 @@ class BillSplitterApp:
         self.next_button.draw(self.screen)
         self.back_button.draw(self.screen)
 
+    def draw_dish_entry(self, surface, rect, dish_name) -> None:
+        """Draw one row of the dish list."""
+        dish_text = self.small_font.render(
+            f"• {self.dishes[dish_name].get_info()}",
+            True,
+            BLACK
+        )
+        surface.blit(dish_text, (rect.x + 20, rect.y))
+
+    def draw_person_entry(self, surface, rect, person_name) -> None:
+        """Draw one row of the people list."""
+        person_text = self.small_font.render(
+            f"• {person_name}",
+            True,
+            BLACK
+        )
+        surface.blit(person_text, (rect.x + 20, rect.y))
+
+    def draw_assign_row(self, surface, rect, dish_name) -> None:
+        """Draw one selectable dish on the assignment screen."""
+        is_selected = (dish_name in self.selected_dishes)
+        rect_color = (LIGHT_BLUE if is_selected else LIGHT_GRAY)
+
+        pygame.draw.rect(
+            surface,
+            rect_color,
+            rect,
+            border_radius=5
+        )
+        pygame.draw.rect(
+            surface,
+            DARK_GRAY,
+            rect,
+            2,
+            border_radius=5
+        )
+
+        selection_indicator = (
+            "(selected) " if is_selected else "  "
+        )
+        text = self.normal_font.render(
+            selection_indicator + self.dishes[dish_name].get_info(),
+            True,
+            BLACK
+        )
+        surface.blit(text, (rect.x + 10, rect.y + 5))
+
     @safe_draw
     def draw_file_saved_screen(self, filename: str) -> None:
         """Draw the file saved confirmation screen."""
@@ -743,6 +1045,9 @@ class BillSplitterApp:
             )
             self.screen.blit(self.qr_image, qr_rect)
 
+        self.save_button.text = (
+            "Saving..." if self.saving else "Save Bill Summary to File"
+        )
         self.save_button.draw(self.screen)
 
     def add_dish(self) -> None:
@@ -762,6 +1067,8 @@ class BillSplitterApp:
         except ValueError:
             return
         self.dishes[dish_name] = Dish(dish_name, dish_price)
+        self.dish_names.append(dish_name)
+        self.dish_list.scroll_to_end()
         self.dish_name_input.text = ""
         self.dish_price_input.text = ""
 
@@ -775,27 +1082,41 @@ class BillSplitterApp:
         if not person_name or person_name in self.people:
             return
         self.people[person_name] = Person(person_name)
+        self.person_names.append(person_name)
+        self.people_list.scroll_to_end()
         self.person_name_input.text = ""
 
     def calculate_bills(self) -> None:
         """
         Calculate total bill for each person.
         
-        Splits shared dishes evenly among eaters.
+        Splits shared dishes evenly among eaters in whole
+        satang, handing leftover satang to the first eaters
+        so every dish's shares add up to its price exactly.
         """
         for person in self.people.values():
             person._total = 0.0
         for dish in dish_iterator(self.dishes):
-            shared_price = dish.get_shared_price()
-            for eater_name in dish.eaters:
+            if not dish.eaters:
+                continue
+            price_satang = round(dish.price * 100)
+            base_share, leftover = divmod(
+                price_satang, len(dish.eaters)
+            )
+            for position, eater_name in enumerate(dish.eaters):
+                share = base_share + (1 if position < leftover else 0)
                 if eater_name in self.people:
                     self.people[eater_name].add_to_total(
-                        shared_price
+                        share / 100
                     )
 
     def handle_events(self) -> None:
         """Handle all pygame events based on current state."""
+        self.save_worker.poll()
+
         for event in pygame.event.get():
+            if event.type not in INPUT_EVENTS:
+                self.full_redraw = True
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -805,6 +1126,7 @@ class BillSplitterApp:
 
             elif self.state == STATE_ADD_DISHES:
                 self.dish_name_input.handle_event(event)
+                self.dish_list.handle_event(event)
                 self.dish_price_input.handle_event(event)
                 if self.add_dish_button.handle_event(event):
                     self.add_dish()
@@ -816,6 +1138,7 @@ class BillSplitterApp:
 
             elif self.state == STATE_ADD_PEOPLE:
                 self.person_name_input.handle_event(event)
+                self.people_list.handle_event(event)
                 if self.add_person_button.handle_event(event):
                     self.add_person()
                 if (self.next_button.handle_event(event)
@@ -827,20 +1150,18 @@ class BillSplitterApp:
                     self.state = STATE_ADD_DISHES
 
             elif self.state == STATE_ASSIGN_ORDERS:
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for dish_name, dish_rect in (
-                        self.dish_rects.items()
-                    ):
-                        if dish_rect.collidepoint(event.pos):
-                            if (dish_name
-                                    in self.selected_dishes):
-                                self.selected_dishes.remove(
-                                    dish_name
-                                )
-                            else:
-                                self.selected_dishes.append(
-                                    dish_name
-                                )
+                if self.assign_list.handle_event(event):
+                    row = self.assign_list.clicked_index
+                    dish_name = self.dish_names[row]
+                    if dish_name in self.selected_dishes:
+                        self.selected_dishes.remove(dish_name)
+                    else:
+                        self.selected_dishes.append(dish_name)
+                    self.dirty_rects.append(
+                        self.assign_list.row_rect(row).clip(
+                            self.assign_list.rect
+                        )
+                    )
 
                 if self.next_button.handle_event(event):
                     people_list = list(self.people.values())
@@ -868,11 +1189,9 @@ class BillSplitterApp:
                     self.state = STATE_ADD_PEOPLE
 
             elif self.state == STATE_RESULTS:
-                if self.save_button.handle_event(event):
-                    self.saved_filename = (
-                        self.save_results_to_file()
-                    )
-                    self.state = STATE_FILE_SAVED
+                if (self.save_button.handle_event(event)
+                        and not self.saving):
+                    self.save_results_to_file()
 
             elif self.state == STATE_FILE_SAVED:
                 if self.restart_button.handle_event(event):
@@ -880,9 +1199,27 @@ class BillSplitterApp:
                 elif self.quit_button.handle_event(event):
                     self.running = False
 
-    def draw(self) -> None:
+    def view_key(self) -> tuple:
+        """Values whose change means the whole screen must be repainted."""
+        return (
+            self.state, len(self.dishes), len(self.people),
+            self.current_person_index, self.saving,
+            self.saved_filename
+        )
+
+    def collect_dirty_rects(self) -> list:
+        """Rects of changed components and toggled dish rows."""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        for component in self.components:
+            if component.dirty:
+                rects.append(component.rect)
+                component.dirty = False
+        return rects
+
+    def draw(self, dirty_rects: list = None) -> None:
         """Draw the current screen based on state."""
-        with rendering_context(self.screen):
+        with rendering_context(self.screen, WHITE, dirty_rects):
             if self.state == STATE_MENU:
                 self.draw_menu_screen()
             elif self.state == STATE_ADD_DISHES:
@@ -901,9 +1238,21 @@ class BillSplitterApp:
     def run(self) -> None:
         """Main application loop."""
         while self.running:
+            view = self.view_key()
             self.handle_events()
-            self.draw()
+            for virtual_list in self.lists:
+                virtual_list.update()
+
+            dirty_rects = self.collect_dirty_rects()
+            if self.full_redraw or self.view_key() != view:
+                self.draw()
+                self.full_redraw = False
+                # The full repaint already covers anything marked dirty
+                self.collect_dirty_rects()
+            elif dirty_rects:
+                self.draw(dirty_rects)
             self.clock.tick(FPS)
+        self.save_worker.close()
 
 
 if __name__ == "__main__":
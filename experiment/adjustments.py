@@ -0,0 +1,179 @@
+"""
+Bill adjustments for the Bill Splitter application.
+Applies service charge, VAT, discounts and rounding after bills are calculated.
+
+Every stage except rounding is affine in a person's amount
+(amount -> multiplier * amount + offset), so the whole pipeline folds into
+one multiplier and offset. The adjusted bill total is rounded once and then
+shared out in proportion to each person's adjusted amount, so the parts
+always add up to the total.
+"""
+from abc import ABC, abstractmethod
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional, Sequence, Tuple
+from models import Person
+from money import allocate, to_satang, from_satang
+
+class Adjustment(ABC):
+    """Abstract base class for an affine bill adjustment stage."""
+
+    @abstractmethod
+    def fold(self, subtotal: float, people_count: int) -> Tuple[float, float]:
+        """
+        Return this stage as (multiplier, offset) applied to each person's amount.
+
+        Args:
+            subtotal: Bill total going into this stage
+            people_count: Number of people sharing the bill
+
+        Returns:
+            Tuple of (multiplier, per-person offset)
+        """
+        pass
+
+
+class Surcharge(Adjustment):
+    """Percentage added to the bill, labelled e.g. "Service charge" or "VAT"."""
+
+    def __init__(self, rate: float, label: str = "Surcharge"):
+        self.rate = rate
+        self.label = label
+
+    def fold(self, subtotal: float, people_count: int) -> Tuple[float, float]:
+        return 1.0 + self.rate, 0.0
+
+
+class PercentageDiscount(Adjustment):
+    """Discount of a fraction of the bill, e.g. 0.15 for 15% off."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+
+    def fold(self, subtotal: float, people_count: int) -> Tuple[float, float]:
+        return 1.0 - self.rate, 0.0
+
+
+class FixedDiscount(Adjustment):
+    """
+    Discount of a fixed amount off the bill.
+
+    Shared in proportion to each person's amount by default, or equally
+    per person when per_person is True. Nobody is discounted below zero:
+    when an equal share is more than someone owes, the rest of it is
+    taken off everyone else in proportion to what they owe.
+    """
+
+    def __init__(self, amount: float, per_person: bool = False):
+        self.amount = amount
+        self.per_person = per_person
+
+    def fold(self, subtotal: float, people_count: int) -> Tuple[float, float]:
+        if self.per_person:
+            if people_count == 0:
+                return 1.0, 0.0
+            return 1.0, -self.amount / people_count
+        if subtotal <= 0:
+            return 1.0, 0.0
+        # Never discount below zero
+        return max(0.0, 1.0 - self.amount / subtotal), 0.0
+
+
+class Rounding:
+    """Final stage rounding the bill half up to a step, e.g. 0.25 or 1.0; everyone pays whole steps."""
+
+    def __init__(self, step: float = 0.01):
+        self.step_satang = to_satang(step)
+        if self.step_satang <= 0:
+            raise ValueError("Rounding step must be at least 0.01")
+
+    def round(self, amount: float) -> int:
+        """Round an amount and return it in satang."""
+        return self.round_steps(amount) * self.step_satang
+
+    def round_steps(self, amount: float) -> int:
+        """Round an amount and return it as a whole number of steps."""
+        steps = (Decimal(to_satang(amount)) / self.step_satang).quantize(
+            Decimal(1), rounding=ROUND_HALF_UP
+        )
+        return int(steps)
+
+
+class AdjustmentPipeline:
+    """Ordered adjustment stages, optionally ending with a Rounding stage."""
+
+    def __init__(self, stages: Sequence[Adjustment], rounding: Optional[Rounding] = None):
+        self.stages = list(stages)
+        self.rounding = rounding if rounding is not None else Rounding()
+
+    def compile(self, subtotal: float, people_count: int) -> Tuple[float, float]:
+        """
+        Fold every stage into a single (multiplier, per-person offset).
+
+        Args:
+            subtotal: Bill total before adjustments
+            people_count: Number of people sharing the bill
+
+        Returns:
+            Tuple of (multiplier, per-person offset)
+        """
+        multiplier, offset = 1.0, 0.0
+        for stage in self.stages:
+            stage_multiplier, stage_offset = stage.fold(subtotal, people_count)
+            multiplier = stage_multiplier * multiplier
+            offset = stage_multiplier * offset + stage_offset
+            subtotal = stage_multiplier * subtotal + stage_offset * people_count
+        return multiplier, offset
+
+    def apply_to_summary(
+        self,
+        person_amounts: List[Tuple[str, float]],
+        total_bill: float
+    ) -> Tuple[List[Tuple[str, float]], float]:
+        """
+        Adjust a summary from BillCalculator.get_bill_summary.
+
+        Args:
+            person_amounts: List of (person_name, amount) tuples
+            total_bill: Bill total before adjustments
+
+        Returns:
+            Tuple of (adjusted (person_name, amount) tuples, adjusted total)
+        """
+        multiplier, offset = self.compile(total_bill, len(person_amounts))
+        rounding = self.rounding
+
+        subtotal = sum(amount for _, amount in person_amounts)
+        total_steps = max(
+            0, rounding.round_steps(multiplier * subtotal + offset * len(person_amounts))
+        )
+
+        # Share the rounded total in whole rounding steps; amounts pushed
+        # below zero weigh nothing, so their excess falls on everyone else
+        weights = [max(0, to_satang(multiplier * amount + offset)) for _, amount in person_amounts]
+        adjusted = [
+            (name, from_satang(steps * rounding.step_satang))
+            for (name, _), steps in zip(person_amounts, allocate(total_steps, weights))
+        ]
+        return adjusted, from_satang(total_steps * rounding.step_satang)
+
+    def apply(self, people: Dict[str, Person], total_bill: float) -> float:
+        """
+        Adjust every person's total in place.
+
+        Args:
+            people: Dictionary of person names to Person objects
+            total_bill: Bill total before adjustments
+
+        Returns:
+            The adjusted bill total
+        """
+        person_amounts = [(name, person.total) for name, person in people.items()]
+        adjusted, adjusted_total = self.apply_to_summary(person_amounts, total_bill)
+        for name, amount in adjusted:
+            people[name]._total = amount
+        return adjusted_total
+
+
+def thai_restaurant_pipeline() -> AdjustmentPipeline:
+    """Return the usual 10% service charge then 7% VAT pipeline."""
+    return AdjustmentPipeline([Surcharge(0.10, "Service charge"), Surcharge(0.07, "VAT")])
@@ -0,0 +1,201 @@
+"""
+Memory-mapped reader for the Bill Splitter bill archive.
+Exposes archive rows as zero-copy NumPy column views over mapped segment files.
+"""
+import datetime
+import json
+import mmap
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from bill_archive import (
+    INDEX_FILE, INDEX_FORMAT, NAMES_FILE, ROW_DISH, ROW_FORMAT, ROW_PERSON,
+    segment_filename
+)
+from money import from_satang
+
+ROW_DTYPE = np.dtype([
+    ("timestamp_ns", "<i8"),
+    ("bill_id", "<u8"),
+    ("name_id", "<u4"),
+    ("kind", "<u2"),
+    ("eater_count", "<u2"),
+    ("amount_satang", "<i8"),
+])
+INDEX_DTYPE = np.dtype([
+    ("bill_id", "<u8"),
+    ("timestamp_ns", "<i8"),
+    ("segment", "<u4"),
+    ("first_row", "<u4"),
+    ("row_count", "<u4"),
+    ("reserved", "<u4"),
+    ("total_satang", "<i8"),
+])
+assert ROW_DTYPE.itemsize == ROW_FORMAT.size
+assert INDEX_DTYPE.itemsize == INDEX_FORMAT.size
+
+
+def month_range(year: int, month: int) -> Tuple[int, int]:
+    """
+    Return the [start, end) nanosecond range of a calendar month in local time.
+
+    Args:
+        year: Four-digit year
+        month: Month number, 1-12
+
+    Returns:
+        Tuple of (start_ns, end_ns)
+    """
+    start = datetime.datetime(year, month, 1)
+    end = datetime.datetime(year + month // 12, month % 12 + 1, 1)
+    return int(start.timestamp() * 1e9), int(end.timestamp() * 1e9)
+
+
+class ArchiveReader:
+    """
+    Read-only, memory-mapped view of a BillArchive directory.
+
+    Segments are mapped once and exposed as structured NumPy arrays that
+    share the mapped pages, so queries run as column scans with no
+    per-bill Python objects. Only committed rows (those covered by
+    bills.idx) are visible.
+    """
+
+    def __init__(self, directory: str = "bills_archive"):
+        self.directory = directory
+        self._maps: List[mmap.mmap] = []
+        self._segments: List[np.ndarray] = []
+
+        self.names: List[str] = []
+        try:
+            with open(os.path.join(directory, NAMES_FILE), "r", encoding="utf-8") as f:
+                self.names = [json.loads(line) for line in f if line.endswith("\n")]
+        except FileNotFoundError:
+            pass
+        self._name_ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+        try:
+            with open(os.path.join(directory, INDEX_FILE), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        complete = len(data) - len(data) % INDEX_DTYPE.itemsize
+        self.index = np.frombuffer(data[:complete], dtype=INDEX_DTYPE)
+
+        self._map_segments()
+
+    def _map_segments(self) -> None:
+        if len(self.index) == 0:
+            return
+        # Committed rows per segment = end of the last bill stored in it
+        ends = self.index["first_row"].astype(np.int64) + self.index["row_count"]
+        for segment in np.unique(self.index["segment"]).tolist():
+            committed = int(ends[self.index["segment"] == segment].max())
+            if committed == 0:
+                continue
+            path = os.path.join(self.directory, segment_filename(segment))
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            self._segments.append(
+                np.frombuffer(mapped, dtype=ROW_DTYPE, count=committed)
+            )
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the column views and unmap every segment."""
+        self._segments.clear()
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # A caller still holds a column view; the map is released with it
+                pass
+        self._maps.clear()
+
+    @property
+    def bill_count(self) -> int:
+        return len(self.index)
+
+    def name_id(self, name: str) -> Optional[int]:
+        """Return the archive's ID for a name, or None if it never appears."""
+        return self._name_ids.get(name)
+
+    def segments(self) -> Iterator[np.ndarray]:
+        """Yield the zero-copy row view of every mapped segment."""
+        return iter(self._segments)
+
+    def column(self, name: str) -> Iterator[np.ndarray]:
+        """Yield one column (e.g. "amount_satang") as a view per segment."""
+        for rows in self._segments:
+            yield rows[name]
+
+    def _row_mask(
+        self,
+        rows: np.ndarray,
+        kind: int,
+        name_id: Optional[int],
+        start_ns: Optional[int],
+        end_ns: Optional[int]
+    ) -> np.ndarray:
+        mask = rows["kind"] == kind
+        if name_id is not None:
+            mask &= rows["name_id"] == name_id
+        if start_ns is not None:
+            mask &= rows["timestamp_ns"] >= start_ns
+        if end_ns is not None:
+            mask &= rows["timestamp_ns"] < end_ns
+        return mask
+
+    def total_owed(
+        self,
+        person_name: str,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None
+    ) -> float:
+        """
+        Sum what a person owed across all bills in a time range.
+
+        Args:
+            person_name: The person's name
+            start_ns: Inclusive range start in epoch nanoseconds, or None
+            end_ns: Exclusive range end in epoch nanoseconds, or None
+
+        Returns:
+            The total amount in baht
+        """
+        name_id = self.name_id(person_name)
+        if name_id is None:
+            return 0.0
+        total = 0
+        for rows in self._segments:
+            mask = self._row_mask(rows, ROW_PERSON, name_id, start_ns, end_ns)
+            total += int(rows["amount_satang"][mask].sum())
+        return from_satang(total)
+
+    def totals_by_person(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """Return (person_name, amount) for everyone with rows in a time range."""
+        sums = np.zeros(len(self.names), dtype=np.int64)
+        seen = np.zeros(len(self.names), dtype=bool)
+        for rows in self._segments:
+            mask = self._row_mask(rows, ROW_PERSON, None, start_ns, end_ns)
+            name_ids = rows["name_id"][mask]
+            sums += np.bincount(
+                name_ids, weights=rows["amount_satang"][mask], minlength=len(self.names)
+            ).astype(np.int64)
+            seen[name_ids] = True
+        return [(self.names[i], from_satang(int(sums[i]))) for i in np.flatnonzero(seen)]
+
+    def dish_rows(self) -> Iterator[np.ndarray]:
+        """Yield the dish rows of every segment."""
+        for rows in self._segments:
+            yield rows[rows["kind"] == ROW_DISH]
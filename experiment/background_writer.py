@@ -0,0 +1,87 @@
+"""
+Background writer for the Bill Splitter application.
+Runs file and archive writes on a worker thread so the UI loop never blocks on disk.
+"""
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    """
+    Single worker thread that runs write jobs in submission order.
+
+    Jobs run on the worker thread; their callbacks are queued and only
+    run when the owner calls poll(), so callbacks can safely touch UI
+    state from the main loop.
+    """
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        self._done: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._thread = threading.Thread(
+            target=self._worker, name="bill-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._jobs.get()
+            if item is _STOP:
+                return
+            job, callback = item
+            try:
+                result = job()
+            except Exception as e:
+                print(f"Error in background write: {e}")
+                result = None
+            self._done.put((callback, result))
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted jobs whose callbacks have not run yet."""
+        return self._pending
+
+    def submit(
+        self,
+        job: Callable[[], Any],
+        callback: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """
+        Queue a job for the worker thread.
+
+        Args:
+            job: Callable run on the worker thread
+            callback: Called with the job's result (None if it raised) from poll()
+        """
+        self._pending += 1
+        self._jobs.put((job, callback))
+
+    def poll(self) -> int:
+        """
+        Run the callbacks of finished jobs on the calling thread.
+
+        Returns:
+            Number of callbacks run
+        """
+        count = 0
+        while True:
+            try:
+                callback, result = self._done.get_nowait()
+            except queue.Empty:
+                return count
+            self._pending -= 1
+            count += 1
+            if callback is not None:
+                callback(result)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Finish every queued job, stop the worker and run remaining callbacks."""
+        if not self._thread.is_alive():
+            return
+        self._jobs.put(_STOP)
+        self._thread.join(timeout)
+        self.poll()
@@ -0,0 +1,153 @@
+"""
+Batch bill calculation for the Bill Splitter application.
+Settles many bills at once using a sparse dish/eater incidence matrix.
+"""
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from models import Dish, Person
+from split_plan import SplitPlan
+
+Bill = Tuple[Dict[str, Dish], Dict[str, Person]]
+
+
+class BillTotals:
+    """Array-backed table of per-person totals for a batch of bills."""
+
+    def __init__(
+        self,
+        bill_index: np.ndarray,
+        person_names: List[str],
+        totals: np.ndarray,
+        bill_totals: np.ndarray
+    ):
+        self.bill_index = bill_index
+        self.person_names = person_names
+        self.totals = totals
+        self.bill_totals = bill_totals
+        # Rows are grouped by bill, so each bill owns a contiguous slice
+        self._bill_offsets = np.searchsorted(
+            bill_index, np.arange(len(bill_totals) + 1)
+        )
+
+    def __len__(self) -> int:
+        return len(self.person_names)
+
+    @property
+    def bill_count(self) -> int:
+        return len(self.bill_totals)
+
+    def get_bill_summary(self, bill: int) -> Tuple[List[Tuple[str, float]], float]:
+        """
+        Return the summary of one bill in the same shape as
+        BillCalculator.get_bill_summary.
+
+        Args:
+            bill: Position of the bill in the batch
+
+        Returns:
+            Tuple of (list of (person_name, amount) tuples, total_bill)
+        """
+        start, end = self._bill_offsets[bill], self._bill_offsets[bill + 1]
+        person_amounts = list(zip(
+            self.person_names[start:end],
+            self.totals[start:end].tolist()
+        ))
+        return person_amounts, float(self.bill_totals[bill])
+
+    def paid_per_bill(self) -> np.ndarray:
+        """Return the sum of all person totals for every bill."""
+        return np.bincount(
+            self.bill_index, weights=self.totals, minlength=self.bill_count
+        )
+
+
+class BatchBillCalculator:
+    """Calculates person totals for many bills in one vectorized pass."""
+
+    @staticmethod
+    def build_plan(
+        bills: Iterable[Bill]
+    ) -> Tuple[SplitPlan, np.ndarray, np.ndarray, int]:
+        """
+        Flatten the dish/eater assignments of every bill into one SplitPlan.
+
+        The plan's entries are the COO form of the people x dishes
+        incidence matrix, with person rows numbered across all bills.
+
+        Args:
+            bills: Iterable of (dishes, people) dictionary pairs
+
+        Returns:
+            Tuple of (plan, dish_bill_index, person_bill_index, bill_count)
+        """
+        prices: List[float] = []
+        entry_dish: List[int] = []
+        entry_person: List[int] = []
+        entry_fixed: List[float] = []
+        entry_weight: List[float] = []
+        dish_bill_index: List[int] = []
+        person_bill_index: List[int] = []
+        person_names: List[str] = []
+        bill_count = 0
+
+        for bill_number, (dishes, people) in enumerate(bills):
+            row_offset = len(person_names)
+            person_rows_by_name = {}
+            for name in people:
+                person_rows_by_name[name] = row_offset + len(person_rows_by_name)
+                person_names.append(name)
+            person_bill_index.extend([bill_number] * len(people))
+
+            for dish in dishes.values():
+                col = len(prices)
+                eaters = dish.eaters
+                fixed, weights = dish.split_strategy.compile(dish.price, eaters)
+                prices.append(dish.price)
+                dish_bill_index.append(bill_number)
+                entry_dish.extend([col] * len(eaters))
+                entry_person.extend(person_rows_by_name.get(name, -1) for name in eaters)
+                entry_fixed.extend(fixed)
+                entry_weight.extend(weights)
+
+            bill_count = bill_number + 1
+
+        plan = SplitPlan(
+            person_names,
+            np.asarray(prices, dtype=np.float64),
+            np.asarray(entry_dish, dtype=np.intp),
+            np.asarray(entry_person, dtype=np.intp),
+            np.asarray(entry_fixed, dtype=np.float64),
+            np.asarray(entry_weight, dtype=np.float64)
+        )
+        return (
+            plan,
+            np.asarray(dish_bill_index, dtype=np.intp),
+            np.asarray(person_bill_index, dtype=np.intp),
+            bill_count
+        )
+
+    @staticmethod
+    def calculate_bills(bills: Iterable[Bill]) -> BillTotals:
+        """
+        Calculate every person's total across a batch of bills.
+
+        The assignments form a sparse incidence matrix A (people x dishes)
+        and the per-eater share of each dish a dense vector s, so the
+        totals are the single product A @ s evaluated in COO form.
+        Unlike BillCalculator.calculate_bills, no Person object is mutated.
+
+        Args:
+            bills: Iterable of (dishes, people) dictionary pairs
+
+        Returns:
+            BillTotals table with one row per person per bill
+        """
+        plan, dish_bill_index, person_bill_index, bill_count = (
+            BatchBillCalculator.build_plan(bills)
+        )
+        bill_totals = np.bincount(
+            dish_bill_index,
+            weights=plan.prices,
+            minlength=bill_count
+        )
+        return BillTotals(person_bill_index, plan.person_names, plan.totals(), bill_totals)
@@ -0,0 +1,206 @@
+"""
+Benchmark harness for the Bill Splitter core.
+Generates synthetic bills and times each stage of the bill-splitting pipeline.
+
+Usage:
+    python benchmark.py --dishes 1000 --people 200 --eaters-per-dish 5 --output bench.json
+    python benchmark.py --compare bench.json
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+from input_collector import InputCollector
+from bill_calculator import BillCalculator
+from output_manager import OutputManager
+
+STAGES = [
+    "add_dish",
+    "add_person",
+    "assign_selected_dishes_to_current_person",
+    "calculate_bills",
+    "validate_bill_split",
+    "save_bill_to_file",
+]
+
+
+class SyntheticBill:
+    """A reproducible synthetic bill definition."""
+
+    def __init__(self, dishes: int, people: int, eaters_per_dish: int, seed: int = 0):
+        rng = random.Random(seed)
+        self.dish_rows = [
+            (f"Dish {i}", f"{rng.randint(20, 2000)}.{rng.randint(0, 99):02d}")
+            for i in range(dishes)
+        ]
+        self.person_names = [f"Person {i}" for i in range(people)]
+
+        # Invert dish -> eaters into the per-person selections the UI would make
+        eaters_per_dish = min(eaters_per_dish, people)
+        self.selections: List[List[str]] = [[] for _ in range(people)]
+        for dish_name, _ in self.dish_rows:
+            for person_index in rng.sample(range(people), eaters_per_dish):
+                self.selections[person_index].append(dish_name)
+
+
+def time_stage(func: Callable[[], None]) -> float:
+    """Run a callable once and return its wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_once(bill: SyntheticBill, output_dir: str) -> Dict[str, float]:
+    """
+    Run every benchmarked stage once on a fresh InputCollector.
+
+    Args:
+        bill: The synthetic bill to load
+        output_dir: Directory for the saved bill file
+
+    Returns:
+        Dictionary of stage name to elapsed seconds
+    """
+    collector = InputCollector()
+    timings = {}
+
+    def add_dishes():
+        for name, price_str in bill.dish_rows:
+            collector.add_dish(name, price_str)
+
+    def add_people():
+        for name in bill.person_names:
+            collector.add_person(name)
+
+    def assign():
+        for index, selection in enumerate(bill.selections):
+            collector.current_person_index = index
+            collector.selected_dishes = selection
+            collector.assign_selected_dishes_to_current_person()
+
+    def save():
+        with contextlib.redirect_stdout(io.StringIO()):
+            saved = OutputManager.save_bill_to_file(
+                collector.dishes,
+                collector.people,
+                os.path.join(output_dir, "bench_bill.txt")
+            )
+        # A failed save would time only the error path
+        if saved is None:
+            raise RuntimeError("save_bill_to_file failed")
+
+    timings["add_dish"] = time_stage(add_dishes)
+    timings["add_person"] = time_stage(add_people)
+    timings["assign_selected_dishes_to_current_person"] = time_stage(assign)
+    timings["calculate_bills"] = time_stage(
+        lambda: BillCalculator.calculate_bills(collector.dishes, collector.people)
+    )
+    timings["validate_bill_split"] = time_stage(
+        lambda: BillCalculator.validate_bill_split(collector.dishes, collector.people)
+    )
+    timings["save_bill_to_file"] = time_stage(save)
+    return timings
+
+
+def run_benchmark(
+    dishes: int,
+    people: int,
+    eaters_per_dish: int,
+    repeat: int = 5,
+    seed: int = 0
+) -> Dict:
+    """
+    Benchmark all stages and summarise the timings.
+
+    Returns:
+        Result dictionary with parameters, environment and per-stage statistics
+    """
+    bill = SyntheticBill(dishes, people, eaters_per_dish, seed)
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for _ in range(repeat):
+            for stage, seconds in run_once(bill, output_dir).items():
+                samples[stage].append(seconds)
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "dishes": dishes,
+            "people": people,
+            "eaters_per_dish": eaters_per_dish,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "stages": {
+            stage: {
+                "min": min(values),
+                "median": statistics.median(values),
+                "max": max(values),
+            }
+            for stage, values in samples.items()
+        },
+    }
+
+
+def print_results(results: Dict, baseline: Optional[Dict] = None) -> None:
+    """Print a table of median timings, with the ratio to a baseline if given."""
+    print(f"{'STAGE':<45} {'MEDIAN (ms)':>12} {'vs BASE':>8}")
+    print("-" * 67)
+    for stage, stats in results["stages"].items():
+        line = f"{stage:<45} {stats['median'] * 1000:>12.3f}"
+        if baseline and stage in baseline.get("stages", {}):
+            base_median = baseline["stages"][stage]["median"]
+            if base_median > 0:
+                line += f" {stats['median'] / base_median:>7.2f}x"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Bill Splitter core.")
+    parser.add_argument("--dishes", type=int, default=1000)
+    parser.add_argument("--people", type=int, default=200)
+    parser.add_argument("--eaters-per-dish", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading baseline file: {e}")
+
+    # When comparing, reuse the baseline's parameters so the runs are like for like
+    params = baseline["params"] if baseline else {
+        "dishes": args.dishes,
+        "people": args.people,
+        "eaters_per_dish": args.eaters_per_dish,
+        "repeat": args.repeat,
+        "seed": args.seed,
+    }
+    results = run_benchmark(**params)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+Append-only binary bill archive for the Bill Splitter application.
+Stores every saved bill as fixed-width rows in segment files with sidecar indexes.
+
+Directory layout:
+    names.txt             one JSON-encoded person/dish name per line (line number = name ID)
+    segment-NNNNNN.rows   bill rows, ROW_FORMAT each, appended in bill order
+    bills.idx             one INDEX_FORMAT entry per bill (bill ID = entry position)
+    persons.idx           one POSTING_FORMAT entry per (person, bill) pair
+
+A bill is committed once its bills.idx entry is written; anything after the
+last entry is discarded when the archive is reopened, as is any entry whose
+rows did not all reach the segment file.
+"""
+import bisect
+import json
+import os
+import struct
+import time
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from models import Dish, Person
+from bill_calculator import BillCalculator
+from money import to_satang, from_satang
+
+# timestamp_ns, bill_id, name_id, kind, eater_count, amount_satang
+ROW_FORMAT = struct.Struct("<qQIHHq")
+# bill_id, timestamp_ns, segment, first_row, row_count, reserved, total_satang
+INDEX_FORMAT = struct.Struct("<QqIIIIq")
+# name_id, reserved, bill_id
+POSTING_FORMAT = struct.Struct("<IIQ")
+
+ROW_PERSON = 0
+ROW_DISH = 1
+
+NAMES_FILE = "names.txt"
+INDEX_FILE = "bills.idx"
+POSTINGS_FILE = "persons.idx"
+
+
+def segment_filename(segment: int) -> str:
+    """Return the file name of a segment number."""
+    return f"segment-{segment:06d}.rows"
+
+
+class IndexEntry(NamedTuple):
+    """Location and header of one archived bill."""
+    bill_id: int
+    timestamp_ns: int
+    segment: int
+    first_row: int
+    row_count: int
+    total_satang: int
+
+
+class ArchivedBill(NamedTuple):
+    """A bill read back from the archive."""
+    bill_id: int
+    timestamp_ns: int
+    person_amounts: List[Tuple[str, float]]
+    dishes: List[Tuple[str, float, int]]
+    total_bill: float
+
+
+class BillArchive:
+    """Appends bills to, and looks bills up in, a segmented binary archive."""
+
+    def __init__(
+        self,
+        directory: str = "bills_archive",
+        sync_every: int = 32,
+        max_segment_rows: int = 1 << 20
+    ):
+        self.directory = directory
+        self.sync_every = sync_every
+        self.max_segment_rows = max_segment_rows
+        os.makedirs(directory, exist_ok=True)
+
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._entries: List[IndexEntry] = []
+        self._timestamps = array("q")
+        self._person_bills: Dict[int, List[int]] = {}
+        self._unsynced = 0
+
+        self._load_names()
+        self._load_index()
+
+        last = self._entries[-1] if self._entries else None
+        self._segment = last.segment if last else 1
+        self._segment_rows = last.first_row + last.row_count if last else 0
+
+        self._names_file = open(self._path(NAMES_FILE), "a", encoding="utf-8")
+        self._index_file = open(self._path(INDEX_FILE), "ab")
+        self._postings_file = self._open_postings()
+        self._segment_file = self._open_segment()
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def _load_names(self) -> None:
+        path = self._path(NAMES_FILE)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        complete = data.rfind(b"\n") + 1
+        if complete != len(data):
+            # Drop a half-written trailing name so the next one starts on its own line
+            with open(path, "r+b") as f:
+                f.truncate(complete)
+
+        for line in data[:complete].decode("utf-8").splitlines():
+            self._register_name(json.loads(line))
+
+    def _register_name(self, name: str) -> int:
+        name_id = len(self._names)
+        self._names.append(name)
+        self._name_ids[name] = name_id
+        return name_id
+
+    def _load_index(self) -> None:
+        path = self._path(INDEX_FILE)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        complete = len(data) - len(data) % INDEX_FORMAT.size
+        if complete != len(data):
+            # Drop a half-written trailing entry from an interrupted append
+            with open(path, "r+b") as f:
+                f.truncate(complete)
+
+        entries = [
+            IndexEntry(bill_id, timestamp_ns, segment, first_row, row_count, total)
+            for bill_id, timestamp_ns, segment, first_row, row_count, _, total
+            in INDEX_FORMAT.iter_unpack(data[:complete])
+        ]
+
+        # An entry can reach disk before its rows do; such bills were never
+        # fully written, so drop them along with everything after them
+        segment_sizes: Dict[int, int] = {}
+        while entries:
+            last = entries[-1]
+            if last.segment not in segment_sizes:
+                try:
+                    size = os.path.getsize(self._path(segment_filename(last.segment)))
+                except FileNotFoundError:
+                    size = 0
+                segment_sizes[last.segment] = size
+            if (last.first_row + last.row_count) * ROW_FORMAT.size <= segment_sizes[last.segment]:
+                break
+            entries.pop()
+        if len(entries) * INDEX_FORMAT.size != complete:
+            with open(path, "r+b") as f:
+                f.truncate(len(entries) * INDEX_FORMAT.size)
+
+        self._entries = entries
+        self._timestamps.extend(entry.timestamp_ns for entry in entries)
+
+    def _open_postings(self):
+        # Postings are written before the index entry, so trim any that
+        # belong to a bill whose index entry never made it to disk
+        path = self._path(POSTINGS_FILE)
+        f = open(path, "a+b")
+        f.seek(0)
+        data = f.read()
+        keep = len(data) - len(data) % POSTING_FORMAT.size
+        while keep:
+            _, _, bill_id = POSTING_FORMAT.unpack_from(data, keep - POSTING_FORMAT.size)
+            if bill_id < len(self._entries):
+                break
+            keep -= POSTING_FORMAT.size
+        if keep != len(data):
+            f.truncate(keep)
+        for name_id, _, bill_id in POSTING_FORMAT.iter_unpack(data[:keep]):
+            self._person_bills.setdefault(name_id, []).append(bill_id)
+        return f
+
+    def _open_segment(self):
+        path = self._path(segment_filename(self._segment))
+        f = open(path, "a+b")
+        committed = self._segment_rows * ROW_FORMAT.size
+        f.seek(0, os.SEEK_END)
+        # Only ever shrink: _load_index has already dropped entries whose
+        # rows are missing, so the file is never shorter than committed
+        if f.tell() > committed:
+            f.truncate(committed)
+        return f
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "BillArchive":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.close()
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._register_name(name)
+            self._names_file.write(json.dumps(name) + "\n")
+        return name_id
+
+    def name_of(self, name_id: int) -> str:
+        """Return the name stored under a name ID."""
+        return self._names[name_id]
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    def append(
+        self,
+        person_amounts: Iterable[Tuple[str, float]],
+        total_bill: float,
+        dishes: Iterable[Dish] = (),
+        timestamp_ns: Optional[int] = None
+    ) -> int:
+        """
+        Append one bill to the archive.
+
+        Args:
+            person_amounts: (person_name, amount) tuples, e.g. from get_bill_summary
+            total_bill: Total bill amount
+            dishes: Dishes to record alongside the person amounts
+            timestamp_ns: Bill time in nanoseconds since the epoch. If None, uses now.
+                Raised to the previous bill's time if earlier, so bills stay
+                in time order for find_bills even if the clock steps back
+
+        Returns:
+            The new bill's ID
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        if self._timestamps and timestamp_ns < self._timestamps[-1]:
+            timestamp_ns = self._timestamps[-1]
+        bill_id = len(self._entries)
+
+        rows = bytearray()
+        postings = bytearray()
+        person_ids = []
+        for name, amount in person_amounts:
+            name_id = self._name_id(name)
+            rows += ROW_FORMAT.pack(
+                timestamp_ns, bill_id, name_id, ROW_PERSON, 0, to_satang(amount)
+            )
+            postings += POSTING_FORMAT.pack(name_id, 0, bill_id)
+            person_ids.append(name_id)
+        for dish in dishes:
+            rows += ROW_FORMAT.pack(
+                timestamp_ns, bill_id, self._name_id(dish.name), ROW_DISH,
+                min(dish.eater_count, 0xFFFF), to_satang(dish.price)
+            )
+        row_count = len(rows) // ROW_FORMAT.size
+
+        if self._segment_rows and self._segment_rows + row_count > self.max_segment_rows:
+            self._segment_file.close()
+            self._segment += 1
+            self._segment_rows = 0
+            self._segment_file = self._open_segment()
+
+        entry = IndexEntry(
+            bill_id, timestamp_ns, self._segment, self._segment_rows,
+            row_count, to_satang(total_bill)
+        )
+
+        # Names, rows and postings reach the OS first; the index entry commits the bill
+        self._names_file.flush()
+        self._segment_file.write(rows)
+        self._segment_file.flush()
+        self._postings_file.write(postings)
+        self._postings_file.flush()
+        self._index_file.write(INDEX_FORMAT.pack(
+            entry.bill_id, entry.timestamp_ns, entry.segment,
+            entry.first_row, entry.row_count, 0, entry.total_satang
+        ))
+
+        self._entries.append(entry)
+        self._timestamps.append(timestamp_ns)
+        self._segment_rows += row_count
+        for name_id in person_ids:
+            self._person_bills.setdefault(name_id, []).append(bill_id)
+
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+        return bill_id
+
+    def append_bill(self, dishes: Dict[str, Dish], people: Dict[str, Person]) -> int:
+        """Append a calculated bill using BillCalculator.get_bill_summary."""
+        person_amounts, total_bill = BillCalculator.get_bill_summary(dishes, people)
+        return self.append(person_amounts, total_bill, dishes.values())
+
+    def sync(self) -> None:
+        """
+        Flush and fsync every open file, making all appended bills durable.
+
+        The index is synced last; an entry that still reaches disk ahead
+        of its rows is dropped when the archive is reopened.
+        """
+        for f in (self._names_file, self._segment_file, self._postings_file, self._index_file):
+            f.flush()
+            os.fsync(f.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close the archive."""
+        if self._index_file.closed:
+            return
+        self.sync()
+        for f in (self._names_file, self._segment_file, self._postings_file, self._index_file):
+            f.close()
+
+    def get_entry(self, bill_id: int) -> IndexEntry:
+        """Return the index entry of a bill."""
+        return self._entries[bill_id]
+
+    def find_bills(self, start_ns: int, end_ns: int) -> List[IndexEntry]:
+        """
+        Return bills with start_ns <= timestamp < end_ns.
+
+        Bills are appended in time order, so this is a binary search
+        over the in-memory timestamp column.
+        """
+        lo = bisect.bisect_left(self._timestamps, start_ns)
+        hi = bisect.bisect_left(self._timestamps, end_ns)
+        return self._entries[lo:hi]
+
+    def bills_for_person(self, name: str) -> List[int]:
+        """
+        Return the IDs of every bill a person appears on, in bill order.
+
+        Served from a per-person map built from the postings index on
+        open and kept current by append.
+        """
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return []
+        return list(self._person_bills.get(name_id, ()))
+
+    def read_bill(self, bill_id: int) -> ArchivedBill:
+        """Read a single bill back from its segment."""
+        entry = self._entries[bill_id]
+        if entry.segment == self._segment:
+            self._segment_file.flush()
+        with open(self._path(segment_filename(entry.segment)), "rb") as f:
+            f.seek(entry.first_row * ROW_FORMAT.size)
+            data = f.read(entry.row_count * ROW_FORMAT.size)
+
+        person_amounts = []
+        dishes = []
+        for _, _, name_id, kind, eater_count, amount in ROW_FORMAT.iter_unpack(data):
+            if kind == ROW_PERSON:
+                person_amounts.append((self._names[name_id], from_satang(amount)))
+            else:
+                dishes.append((self._names[name_id], from_satang(amount), eater_count))
+        return ArchivedBill(
+            bill_id, entry.timestamp_ns, person_amounts, dishes,
+            from_satang(entry.total_satang)
+        )
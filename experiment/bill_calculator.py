@@ -2,8 +2,12 @@
 Bill calculation logic for the Bill Splitter application.
 Handles splitting costs and generating results.
 """
+from fractions import Fraction
 from typing import Dict, List, Tuple
 from models import Dish, Person
+from money import SatangLedger, allocate, split_evenly, to_satang, from_satang
+from split_plan import SplitPlan
+from split_strategies import EQUAL_SPLIT
 
 def dish_iterator(dishes: Dict[str, Dish]):
     """Iterator for dishes dictionary values."""
@@ -22,16 +26,85 @@ class BillCalculator:
             dishes: Dictionary of dish names to Dish objects
             people: Dictionary of person names to Person objects
         """
-        # Reset all totals
-        for person in people.values():
-            person._total = 0.0
-        
-        # Calculate shared costs
+        # Every dish's split strategy is compiled into one flat plan,
+        # so mixed strategies are still evaluated in a single pass
+        SplitPlan.compile(dishes, people).apply(people)
+
+    @staticmethod
+    def calculate_bills_exact(
+        dishes: Dict[str, Dish],
+        people: Dict[str, Person]
+    ) -> SatangLedger:
+        """
+        Calculate each person's bill in integer satang.
+
+        Each dish price is split with the largest-remainder rule under
+        the dish's split strategy, so the shares of a dish always add up
+        to its price. Person totals are set
+        from the ledger, so displayed amounts add up to the bill as well.
+
+        Args:
+            dishes: Dictionary of dish names to Dish objects
+            people: Dictionary of person names to Person objects
+
+        Returns:
+            SatangLedger holding every person's total in satang
+        """
+        ledger = SatangLedger(people.keys())
+
         for dish in dish_iterator(dishes):
-            shared_price = dish.get_shared_price()
-            for eater_name in dish.eaters:
-                if eater_name in people:
-                    people[eater_name].add_to_total(shared_price)
+            ledger.add_bill_amount(to_satang(dish.price))
+            for eater_name, share in BillCalculator.get_dish_shares_exact(dish).items():
+                if eater_name in ledger:
+                    ledger.add(eater_name, share)
+
+        for name, person in people.items():
+            person._total = from_satang(ledger.get(name))
+
+        return ledger
+
+    @staticmethod
+    def get_dish_shares_exact(dish: Dish) -> Dict[str, int]:
+        """
+        Split one dish's price in integer satang under its split strategy.
+
+        Args:
+            dish: The dish to split
+
+        Returns:
+            Dictionary of eater names to satang shares, adding up to the price
+        """
+        price = to_satang(dish.price)
+        eaters = dish.eaters
+        if dish.split_strategy is EQUAL_SPLIT:
+            shares = split_evenly(price, len(eaters))
+        else:
+            fixed, weights = dish.split_strategy.compile(dish.price, eaters)
+            fixed = [to_satang(amount) for amount in fixed]
+            residual = allocate(
+                price - sum(fixed),
+                [Fraction(weight) for weight in weights]
+            )
+            shares = [f + r for f, r in zip(fixed, residual)]
+        return dict(zip(eaters, shares))
+
+    @staticmethod
+    def validate_ledger(ledger: SatangLedger) -> Tuple[bool, str]:
+        """
+        Validate an exact bill split produced by calculate_bills_exact.
+
+        Args:
+            ledger: The ledger returned by calculate_bills_exact
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not ledger.is_balanced():
+            return False, (
+                f"Total mismatch: Bill={from_satang(ledger.billed):.2f}, "
+                f"Paid={from_satang(ledger.allocated):.2f}"
+            )
+        return True, ""
 
     @staticmethod
     def get_total_bill(dishes: Dict[str, Dish]) -> float:
@@ -90,7 +163,7 @@ class BillCalculator:
         # Check if all dishes have at least one eater
         unassigned_dishes = [
             dish.name for dish in dishes.values() 
-            if len(dish.eaters) == 0
+            if dish.eater_count == 0
         ]
         
         if unassigned_dishes:
@@ -0,0 +1,287 @@
+"""
+Query engine over archived bills for the Bill Splitter application.
+Answers filtered sums, counts and top-k questions with vectorized column scans.
+
+Example:
+    with ArchiveReader("bills_archive") as reader:
+        engine = BillQueryEngine.from_archive(reader)
+        start, end = month_range(2025, 11)
+        engine.query().between(start, end).top_k(3)
+"""
+import datetime
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from archive_reader import ArchiveReader
+from bill_archive import ROW_DISH, ROW_PERSON
+from money import from_satang
+
+_COLUMNS = ("timestamp_ns", "bill_id", "name_id", "amount_satang")
+_NS_PER_QUARTER_HOUR = 900_000_000_000
+_NS_PER_DAY = 86_400_000_000_000
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def _day_numbers(timestamps_ns: np.ndarray) -> np.ndarray:
+    """
+    Map epoch-nanosecond timestamps to local-time date ordinals.
+
+    The local UTC offset is looked up once per distinct quarter hour
+    (offsets only change on quarter-hour boundaries), then applied to
+    every timestamp in one vectorized step.
+    """
+    quarters, inverse = np.unique(timestamps_ns // _NS_PER_QUARTER_HOUR, return_inverse=True)
+    offsets_ns = np.array(
+        [time.localtime(quarter * 900).tm_gmtoff for quarter in quarters.tolist()],
+        dtype=np.int64
+    ) * 1_000_000_000
+    local_ns = timestamps_ns + offsets_ns[inverse]
+    return local_ns // _NS_PER_DAY + _EPOCH_ORDINAL
+
+
+class BillQueryEngine:
+    """
+    Column store of archived person and dish rows with per-day rollups.
+
+    Person rows are held sorted by timestamp, so date ranges are binary
+    searches. Per-day, per-person rollups are built once, and queries
+    that cover whole days without a dish filter read them instead of
+    the rows.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        persons: Dict[str, np.ndarray],
+        dishes: Dict[str, np.ndarray]
+    ):
+        """
+        Args:
+            names: Name table indexed by name_id
+            persons: Person row columns (timestamp_ns, bill_id, name_id, amount_satang)
+            dishes: Dish row columns, same layout with the dish price as amount
+        """
+        self.names = names
+        self._name_ids = {name: i for i, name in enumerate(names)}
+
+        order = np.argsort(persons["timestamp_ns"], kind="stable")
+        self.persons = {column: np.asarray(persons[column])[order] for column in _COLUMNS}
+        self.dishes = {column: np.asarray(dishes[column]) for column in _COLUMNS}
+        self._build_rollups()
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, np.ndarray]:
+        return {column: np.array([], dtype=np.int64) for column in _COLUMNS}
+
+    @classmethod
+    def from_archive(cls, reader: ArchiveReader, legacy=None) -> "BillQueryEngine":
+        """
+        Build an engine from an open ArchiveReader.
+
+        Args:
+            reader: The binary archive to query
+            legacy: Optional LegacyStore of migrated text bills to include.
+                Its bill IDs are shifted past the archive's so they stay unique.
+
+        Returns:
+            BillQueryEngine
+        """
+        names = list(reader.names)
+        persons = [cls._empty_columns()]
+        dishes = [cls._empty_columns()]
+        for rows in reader.segments():
+            for kind, blocks in ((ROW_PERSON, persons), (ROW_DISH, dishes)):
+                selected = rows[rows["kind"] == kind]
+                blocks.append({column: selected[column].astype(np.int64) for column in _COLUMNS})
+
+        if legacy is not None:
+            name_ids = {name: i for i, name in enumerate(names)}
+            for name in legacy.names:
+                if name not in name_ids:
+                    name_ids[name] = len(names)
+                    names.append(name)
+            remap = np.array([name_ids[name] for name in legacy.names], dtype=np.int64)
+            for source, amounts, blocks in (
+                (legacy.persons, "amount_satang", persons),
+                (legacy.dishes, "price_satang", dishes),
+            ):
+                blocks.append({
+                    "timestamp_ns": source["timestamp_ns"].astype(np.int64),
+                    "bill_id": source["bill_id"].astype(np.int64) + reader.bill_count,
+                    "name_id": remap[source["name_id"]],
+                    "amount_satang": source[amounts].astype(np.int64),
+                })
+
+        def concat(blocks):
+            return {column: np.concatenate([b[column] for b in blocks]) for column in _COLUMNS}
+
+        return cls(names, concat(persons), concat(dishes))
+
+    def _build_rollups(self) -> None:
+        days = _day_numbers(self.persons["timestamp_ns"])
+        self._row_days = days
+
+        # One rollup row per (day, person), sorted by day then name_id
+        keys = days * len(self.names) + self.persons["name_id"]
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        self.rollup_day = days[first]
+        self.rollup_name = self.persons["name_id"][first]
+        self.rollup_amount = np.bincount(
+            inverse, weights=self.persons["amount_satang"], minlength=len(unique_keys)
+        ).astype(np.int64)
+        self.rollup_bills = np.bincount(inverse, minlength=len(unique_keys))
+
+        # Distinct bills per day, for unfiltered counts
+        bill_keys = np.unique(np.stack([days, self.persons["bill_id"]]), axis=1)
+        self.day_numbers, self.day_bills = np.unique(bill_keys[0], return_counts=True)
+
+    def name_id(self, name: str) -> Optional[int]:
+        """Return the ID of a person or dish name, or None if it never appears."""
+        return self._name_ids.get(name)
+
+    def query(self) -> "BillQuery":
+        """Start a new query over every archived bill."""
+        return BillQuery(self)
+
+
+class BillQuery:
+    """
+    Filter chain over a BillQueryEngine.
+
+    Filter methods return self so they can be chained; sum, count,
+    top_k and by_person run the query.
+    """
+
+    def __init__(self, engine: BillQueryEngine):
+        self._engine = engine
+        self._start_ns: Optional[int] = None
+        self._end_ns: Optional[int] = None
+        self._first_day: Optional[int] = None
+        self._last_day: Optional[int] = None
+        self._person_id: Optional[int] = None
+        self._dish_ids: Optional[List[int]] = None
+        self._no_match = False
+
+    def between(self, start_ns: int, end_ns: int) -> "BillQuery":
+        """Keep bills with start_ns <= timestamp < end_ns."""
+        self._start_ns, self._end_ns = start_ns, end_ns
+        self._first_day = self._last_day = None
+        return self
+
+    def on_days(self, first: datetime.date, last: datetime.date) -> "BillQuery":
+        """Keep bills dated first..last inclusive (local time); served from rollups."""
+        self._first_day, self._last_day = first.toordinal(), last.toordinal()
+        self._start_ns = self._end_ns = None
+        return self
+
+    def person(self, name: str) -> "BillQuery":
+        """Keep only the given person's amounts."""
+        name_id = self._engine.name_id(name)
+        if name_id is None:
+            self._no_match = True
+        self._person_id = name_id
+        return self
+
+    def dish(self, name: str) -> "BillQuery":
+        """Keep only bills that include the given dish (repeat to require several)."""
+        name_id = self._engine.name_id(name)
+        if name_id is None:
+            self._no_match = True
+        else:
+            self._dish_ids = (self._dish_ids or []) + [name_id]
+        return self
+
+    def _uses_rollups(self) -> bool:
+        return self._dish_ids is None and self._start_ns is None
+
+    def _rollup_slice(self) -> slice:
+        engine = self._engine
+        lo, hi = 0, len(engine.rollup_day)
+        if self._first_day is not None:
+            lo = int(np.searchsorted(engine.rollup_day, self._first_day, side="left"))
+            hi = int(np.searchsorted(engine.rollup_day, self._last_day, side="right"))
+        return slice(lo, hi)
+
+    def _row_mask(self) -> Tuple[slice, np.ndarray]:
+        engine = self._engine
+        persons = engine.persons
+        timestamps = persons["timestamp_ns"]
+        lo, hi = 0, len(timestamps)
+        if self._start_ns is not None:
+            lo = int(np.searchsorted(timestamps, self._start_ns, side="left"))
+            hi = int(np.searchsorted(timestamps, self._end_ns, side="left"))
+        elif self._first_day is not None:
+            lo = int(np.searchsorted(engine._row_days, self._first_day, side="left"))
+            hi = int(np.searchsorted(engine._row_days, self._last_day, side="right"))
+        rows = slice(lo, hi)
+
+        mask = np.ones(hi - lo, dtype=bool)
+        if self._person_id is not None:
+            mask &= persons["name_id"][rows] == self._person_id
+        if self._dish_ids is not None:
+            for dish_id in self._dish_ids:
+                bills = engine.dishes["bill_id"][engine.dishes["name_id"] == dish_id]
+                mask &= np.isin(persons["bill_id"][rows], bills)
+        return rows, mask
+
+    def sum(self) -> float:
+        """Total amount owed by the matching person rows, in baht."""
+        if self._no_match:
+            return 0.0
+        engine = self._engine
+        if self._uses_rollups():
+            part = self._rollup_slice()
+            amounts = engine.rollup_amount[part]
+            if self._person_id is not None:
+                amounts = amounts[engine.rollup_name[part] == self._person_id]
+            return from_satang(int(amounts.sum()))
+        rows, mask = self._row_mask()
+        return from_satang(int(engine.persons["amount_satang"][rows][mask].sum()))
+
+    def count(self) -> int:
+        """Number of distinct matching bills."""
+        if self._no_match:
+            return 0
+        engine = self._engine
+        if self._uses_rollups():
+            if self._person_id is None:
+                lo, hi = 0, len(engine.day_numbers)
+                if self._first_day is not None:
+                    lo = int(np.searchsorted(engine.day_numbers, self._first_day, side="left"))
+                    hi = int(np.searchsorted(engine.day_numbers, self._last_day, side="right"))
+                return int(engine.day_bills[lo:hi].sum())
+            part = self._rollup_slice()
+            return int(engine.rollup_bills[part][engine.rollup_name[part] == self._person_id].sum())
+        rows, mask = self._row_mask()
+        return len(np.unique(engine.persons["bill_id"][rows][mask]))
+
+    def by_person(self) -> List[Tuple[str, float]]:
+        """Return (person_name, amount) for every matching person, by name ID."""
+        if self._no_match:
+            return []
+        engine = self._engine
+        if self._uses_rollups():
+            part = self._rollup_slice()
+            name_ids = engine.rollup_name[part]
+            amounts = engine.rollup_amount[part]
+        else:
+            rows, mask = self._row_mask()
+            name_ids = engine.persons["name_id"][rows][mask]
+            amounts = engine.persons["amount_satang"][rows][mask]
+        if self._person_id is not None:
+            keep = name_ids == self._person_id
+            name_ids, amounts = name_ids[keep], amounts[keep]
+
+        sums = np.bincount(name_ids, weights=amounts, minlength=len(engine.names)).astype(np.int64)
+        present = np.unique(name_ids)
+        return [(engine.names[i], from_satang(int(sums[i]))) for i in present.tolist()]
+
+    def top_k(self, k: int) -> List[Tuple[str, float]]:
+        """Return the k people who owe the most, highest first."""
+        totals = self.by_person()
+        if k >= len(totals):
+            return sorted(totals, key=lambda item: item[1], reverse=True)
+        amounts = np.array([amount for _, amount in totals])
+        top = np.argpartition(-amounts, k - 1)[:k]
+        top = top[np.argsort(-amounts[top], kind="stable")]
+        return [totals[i] for i in top.tolist()]
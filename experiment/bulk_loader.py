@@ -0,0 +1,139 @@
+"""
+Bulk import for the Bill Splitter application.
+Streams menu and attendee files (CSV or JSONL) into an InputCollector.
+
+CSV files need a header row with a "name" column (and "price" for menus).
+JSONL files hold one object per line, e.g. {"name": "Pad Thai", "price": 120}.
+"""
+import csv
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+from input_collector import InputCollector
+
+class LoadReport:
+    """Outcome of a bulk load: how many rows were added and which were rejected."""
+
+    def __init__(self, added: int, rejects: List[Tuple[int, str]]):
+        self.added = added
+        self.rejects = sorted(rejects)
+
+    @property
+    def ok(self) -> bool:
+        return not self.rejects
+
+    def summary(self) -> str:
+        """Return a printable summary listing every reject."""
+        lines = [f"Loaded {self.added} row(s), rejected {len(self.rejects)}"]
+        for row_number, reason in self.rejects:
+            lines.append(f"  line {row_number}: {reason}")
+        return "\n".join(lines)
+
+
+class BulkLoader:
+    """Streams rows from CSV/JSONL files into an InputCollector."""
+
+    @staticmethod
+    def iter_rows(
+        path: str,
+        columns: Tuple[str, ...],
+        parse_errors: List[Tuple[int, str]]
+    ) -> Iterator[Tuple]:
+        """
+        Yield (line_number, *values) for each row of a CSV or JSONL file.
+
+        Rows that cannot be parsed are appended to parse_errors instead.
+
+        Args:
+            path: Path of a .csv or .jsonl file
+            columns: Column names to extract, in order
+            parse_errors: List collecting (line_number, reason) for bad rows
+        """
+        extension = os.path.splitext(path)[1].lower()
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            if extension == ".jsonl":
+                yield from BulkLoader._iter_jsonl(f, columns, parse_errors)
+            else:
+                yield from BulkLoader._iter_csv(f, columns, parse_errors)
+
+    @staticmethod
+    def _iter_csv(f, columns, parse_errors) -> Iterator[Tuple]:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        header = [cell.strip().lower() for cell in header]
+        missing = [column for column in columns if column not in header]
+        if missing:
+            parse_errors.append((1, f"Missing column(s): {', '.join(missing)}"))
+            return
+
+        positions = [header.index(column) for column in columns]
+        width = max(positions) + 1
+        for row in reader:
+            line_number = reader.line_num
+            if not row:
+                continue
+            if len(row) < width:
+                parse_errors.append((line_number, "Too few columns"))
+                continue
+            yield (line_number, *[row[i] for i in positions])
+
+    @staticmethod
+    def _iter_jsonl(f, columns, parse_errors) -> Iterator[Tuple]:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                parse_errors.append((line_number, f"Invalid JSON: {e}"))
+                continue
+            if not isinstance(record, dict):
+                parse_errors.append((line_number, "Expected a JSON object"))
+                continue
+            yield (line_number, *[str(record.get(column, "")) for column in columns])
+
+    @staticmethod
+    def load_dishes(collector: InputCollector, path: str) -> Optional[LoadReport]:
+        """
+        Load a menu file into the collector.
+
+        Args:
+            collector: The InputCollector to fill
+            path: Path of a .csv or .jsonl file with name and price columns
+
+        Returns:
+            LoadReport, or None if the file could not be read
+        """
+        parse_errors: List[Tuple[int, str]] = []
+        try:
+            added, rejects = collector.add_dishes(
+                BulkLoader.iter_rows(path, ("name", "price"), parse_errors)
+            )
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Error loading dishes from {path}: {e}")
+            return None
+        return LoadReport(added, rejects + parse_errors)
+
+    @staticmethod
+    def load_people(collector: InputCollector, path: str) -> Optional[LoadReport]:
+        """
+        Load an attendee file into the collector.
+
+        Args:
+            collector: The InputCollector to fill
+            path: Path of a .csv or .jsonl file with a name column
+
+        Returns:
+            LoadReport, or None if the file could not be read
+        """
+        parse_errors: List[Tuple[int, str]] = []
+        try:
+            added, rejects = collector.add_people(
+                BulkLoader.iter_rows(path, ("name",), parse_errors)
+            )
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Error loading people from {path}: {e}")
+            return None
+        return LoadReport(added, rejects + parse_errors)
@@ -6,6 +6,7 @@ Application constants and configuration settings.
 WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 700
 FPS = 60
+IDLE_WAIT_MS = 250  # Longest event wait when nothing is animating
 
 # Colors
 WHITE = (255, 255, 255)
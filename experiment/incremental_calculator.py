@@ -0,0 +1,104 @@
+"""
+Incremental bill calculation for the Bill Splitter application.
+Keeps person totals up to date as dish assignments change.
+"""
+from typing import Dict
+from models import Dish, Person
+from bill_calculator import BillCalculator, dish_iterator
+from money import from_satang
+
+class IncrementalBillCalculator:
+    """
+    Maintains live person totals by reacting to eater changes on dishes.
+
+    A full calculation runs once when attached. Afterwards a
+    Dish.add_eater / Dish.remove_eater only marks its dish dirty, in O(1),
+    and refresh() re-splits each dirty dish once, costing O(eaters of the
+    changed dishes) instead of O(dishes x eaters). Person totals are
+    current after refresh().
+
+    Totals are kept in integer satang and each dish is split exactly as
+    BillCalculator.calculate_bills_exact splits it, so the live totals
+    always match a full exact calculation.
+    """
+
+    def __init__(self, dishes: Dict[str, Dish], people: Dict[str, Person]):
+        self.dishes = dishes
+        self.people = people
+        # Running total per person, in satang
+        self._totals: Dict[str, int] = {}
+        # Shares of eaters who are not (yet) in people, credited once they are added
+        self._pending: Dict[str, int] = {}
+        # Last applied split per dish: eater name -> satang share
+        self._applied: Dict[str, Dict[str, int]] = {}
+        # Dishes changed since the last refresh, by name
+        self._dirty: Dict[str, Dish] = {}
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """Run a full calculation and (re)subscribe to every dish."""
+        ledger = BillCalculator.calculate_bills_exact(self.dishes, self.people)
+        self._totals = {name: ledger.get(name) for name in self.people}
+        self._pending.clear()
+        self._applied.clear()
+        self._dirty.clear()
+        for dish in dish_iterator(self.dishes):
+            shares = BillCalculator.get_dish_shares_exact(dish)
+            for eater_name, share in shares.items():
+                if eater_name not in self._totals:
+                    self._pending[eater_name] = self._pending.get(eater_name, 0) + share
+            self._applied[dish.name] = shares
+            dish.subscribe(self._on_dish_changed)
+
+    def track_dish(self, dish: Dish) -> None:
+        """Start tracking a dish added after the calculator was attached."""
+        self.dishes[dish.name] = dish
+        dish.subscribe(self._on_dish_changed)
+        self._dirty[dish.name] = dish
+
+    def track_person(self, person: Person) -> None:
+        """Start tracking a person added after the calculator was attached."""
+        self.people[person.name] = person
+        self._totals[person.name] = self._pending.pop(person.name, 0)
+        person._total = from_satang(self._totals[person.name])
+
+    def detach(self) -> None:
+        """Unsubscribe from all dishes so they can be edited freely."""
+        for dish in dish_iterator(self.dishes):
+            dish.unsubscribe(self._on_dish_changed)
+        self._applied.clear()
+        self._totals.clear()
+        self._pending.clear()
+        self._dirty.clear()
+
+    def refresh(self) -> None:
+        """Re-split every dish changed since the last refresh and update person totals."""
+        dirty = self._dirty
+        while dirty:
+            _, dish = dirty.popitem()
+            self._resplit(dish)
+
+    def _add(self, eater_name: str, satang: int) -> None:
+        if eater_name in self._totals:
+            total = self._totals[eater_name] + satang
+            self._totals[eater_name] = total
+            self.people[eater_name]._total = from_satang(total)
+        else:
+            self._pending[eater_name] = self._pending.get(eater_name, 0) + satang
+
+    def _on_dish_changed(self, dish: Dish) -> None:
+        """Mark a dish for re-splitting on the next refresh."""
+        self._dirty[dish.name] = dish
+
+    def _resplit(self, dish: Dish) -> None:
+        """Replace the dish's previous split with its current one, touching only changed shares."""
+        new_shares = BillCalculator.get_dish_shares_exact(dish)
+        old_shares = self._applied.get(dish.name, {})
+        changes = {eater_name: -share for eater_name, share in old_shares.items()}
+        for eater_name, share in new_shares.items():
+            changes[eater_name] = changes.get(eater_name, 0) + share
+        for eater_name, change in changes.items():
+            if change:
+                self._add(eater_name, change)
+
+        self._applied[dish.name] = new_shares
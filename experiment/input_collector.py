@@ -2,8 +2,10 @@
 Input collection and validation for the Bill Splitter application.
 Handles user data entry and validation logic.
 """
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from models import Dish, Person
+from incremental_calculator import IncrementalBillCalculator
+from selection import DishSelection
 
 class InputCollector:
     """Manages data collection and storage for dishes and people."""
@@ -12,7 +14,14 @@ class InputCollector:
         self.dishes: Dict[str, Dish] = {}
         self.people: Dict[str, Person] = {}
         self.current_person_index: int = 0
-        self.selected_dishes: list = []
+        # Dish positions in menu order, shared with the selection model
+        self._dish_names: List[str] = []
+        self._dish_index: Dict[str, int] = {}
+        self.selection = DishSelection(self._dish_names, self._dish_index)
+        # Ordered person index for the cursor; None until rebuilt after a roster change
+        self._people_list: Optional[List[Person]] = None
+        # Live person totals; attached only while a screen needs them
+        self.calculator: Optional[IncrementalBillCalculator] = None
 
     def add_dish(self, name: str, price_str: str) -> bool:
         """
@@ -26,22 +35,70 @@ class InputCollector:
             True if dish was added successfully, False otherwise
         """
         name = name.strip()
-        price_str = price_str.strip()
+        price, _ = self._check_dish(name, price_str.strip())
+        if price is None:
+            return False
+        dish = Dish(name, price)
+        self.dishes[name] = dish
+        if self.calculator is not None:
+            self.calculator.track_dish(dish)
+        self._index_dish(name)
+        return True
+
+    def _index_dish(self, name: str) -> None:
+        """Give a newly added dish the next menu position."""
+        self._dish_index[name] = len(self._dish_names)
+        self._dish_names.append(name)
+
+    def _check_dish(self, name: str, price_str: str) -> Tuple[Optional[float], str]:
+        """
+        Validate a stripped dish name and price string.
         
+        Returns:
+            Tuple of (price, "") if valid, or (None, reason) if rejected
+        """
         if not name or not price_str:
-            return False
-            
+            return None, "Missing name or price"
         if name in self.dishes:
-            return False
-            
+            return None, f"Duplicate dish: {name}"
         try:
             price = float(price_str)
-            if price < 0:
-                return False
-            self.dishes[name] = Dish(name, price)
-            return True
         except ValueError:
-            return False
+            return None, f"Invalid price: {price_str}"
+        if price < 0:
+            return None, f"Negative price: {price_str}"
+        return price, ""
+
+    def add_dishes(self, rows: Iterable[Tuple[int, str, str]]) -> Tuple[int, List[Tuple[int, str]]]:
+        """
+        Add many dishes in one call, validating each row like add_dish.
+        
+        Rows are consumed lazily, so a streamed file is never held in memory.
+        
+        Args:
+            rows: Iterable of (row_number, name, price_str) tuples
+            
+        Returns:
+            Tuple of (number of dishes added, list of (row_number, reason) rejects)
+        """
+        dishes = self.dishes
+        check = self._check_dish
+        index_dish = self._index_dish
+        added = 0
+        rejects = []
+        for row_number, name, price_str in rows:
+            name = name.strip()
+            price, reason = check(name, price_str.strip())
+            if price is None:
+                rejects.append((row_number, reason))
+                continue
+            dishes[name] = Dish(name, price)
+            index_dish(name)
+            added += 1
+        if added and self.calculator is not None:
+            # Cheaper to recalculate once than to track each dish
+            self.calculator.recalculate()
+        return added, rejects
 
     def add_person(self, name: str) -> bool:
         """
@@ -61,23 +118,119 @@ class InputCollector:
         if name in self.people:
             return False
             
-        self.people[name] = Person(name)
+        person = Person(name)
+        self.people[name] = person
+        if self.calculator is not None:
+            self.calculator.track_person(person)
+        self._people_list = None
         return True
 
+    def add_people(self, rows: Iterable[Tuple[int, str]]) -> Tuple[int, List[Tuple[int, str]]]:
+        """
+        Add many people in one call, validating each row like add_person.
+        
+        Args:
+            rows: Iterable of (row_number, name) tuples
+            
+        Returns:
+            Tuple of (number of people added, list of (row_number, reason) rejects)
+        """
+        people = self.people
+        added = 0
+        rejects = []
+        for row_number, name in rows:
+            name = name.strip()
+            if not name:
+                rejects.append((row_number, "Missing name"))
+            elif name in people:
+                rejects.append((row_number, f"Duplicate person: {name}"))
+            else:
+                people[name] = Person(name)
+                added += 1
+        if added:
+            self._people_list = None
+            if self.calculator is not None:
+                self.calculator.recalculate()
+        return added, rejects
+
+    def start_live_totals(self) -> IncrementalBillCalculator:
+        """
+        Attach an incremental calculator that keeps person totals current.
+
+        Until stop_live_totals is called, dish and eater changes are tracked;
+        call calculator.refresh() before reading totals.
+
+        Returns:
+            The attached calculator
+        """
+        if self.calculator is None:
+            self.calculator = IncrementalBillCalculator(self.dishes, self.people)
+        return self.calculator
+
+    def stop_live_totals(self) -> None:
+        """Detach the incremental calculator, if attached."""
+        if self.calculator is not None:
+            self.calculator.detach()
+            self.calculator = None
+
+    @property
+    def dish_names(self) -> List[str]:
+        """Dish names in menu order (live list; do not modify)."""
+        return self._dish_names
+
+    @property
+    def people_list(self) -> List[Person]:
+        """People in insertion order (cached list; do not modify)."""
+        return self._get_people_list()
+
+    @property
+    def selected_dishes(self) -> List[str]:
+        """Names of the selected dishes, in menu order."""
+        return list(self.selection)
+
+    @selected_dishes.setter
+    def selected_dishes(self, dish_names: Iterable[str]) -> None:
+        self.selection.clear()
+        self.selection.update(dish_names)
+
+    def is_dish_selected(self, dish_name: str) -> bool:
+        """Check whether a dish is selected, in O(1)."""
+        return dish_name in self.selection
+
     def toggle_dish_selection(self, dish_name: str) -> None:
         """Toggle the selection state of a dish."""
-        if dish_name in self.selected_dishes:
-            self.selected_dishes.remove(dish_name)
-        else:
-            self.selected_dishes.append(dish_name)
+        self.selection.toggle(dish_name)
+
+    def select_all_dishes(self) -> None:
+        """Select every dish."""
+        self.selection.select_all()
+
+    def clear_dish_selection(self) -> None:
+        """Deselect every dish."""
+        self.selection.clear()
+
+    def invert_dish_selection(self) -> None:
+        """Select exactly the dishes that are not currently selected."""
+        self.selection.invert()
+
+    def select_dishes_where(self, predicate: Callable[[Dish], bool]) -> None:
+        """
+        Replace the selection with every dish matching a predicate.
+        
+        Dishes carry no category field, so selecting a category is done
+        with a predicate, e.g. lambda dish: dish.name.startswith("Drink").
+        
+        Args:
+            predicate: Function returning True for dishes to select
+        """
+        self.selection.set_flags(predicate(dish) for dish in self.dishes.values())
 
     def assign_selected_dishes_to_current_person(self) -> None:
         """Assign all selected dishes to the current person."""
-        people_list = list(self.people.values())
+        person = self.get_current_person()
         
-        if self.current_person_index < len(people_list):
-            person = people_list[self.current_person_index]
-            for dish_name in self.selected_dishes:
+        if person is not None:
+            for dish_name in self.selection:
                 if dish_name in self.dishes:
                     self.dishes[dish_name].add_eater(person.name)
 
@@ -90,28 +243,38 @@ class InputCollector:
         """
         self.assign_selected_dishes_to_current_person()
         self.current_person_index += 1
-        self.selected_dishes = []
+        self.selection.clear()
         
         return self.current_person_index < len(self.people)
 
     def get_current_person(self) -> Optional[Person]:
         """Get the person currently being assigned dishes."""
-        people_list = list(self.people.values())
+        people_list = self._get_people_list()
         
         if 0 <= self.current_person_index < len(people_list):
             return people_list[self.current_person_index]
         return None
 
+    def _get_people_list(self) -> List[Person]:
+        """Return people in insertion order, rebuilding only after the roster changed."""
+        if self._people_list is None:
+            self._people_list = list(self.people.values())
+        return self._people_list
+
     def is_last_person(self) -> bool:
         """Check if the current person is the last one to assign."""
         return self.current_person_index >= len(self.people) - 1
 
     def reset(self) -> None:
         """Reset all collected data."""
+        self.stop_live_totals()
         self.dishes.clear()
         self.people.clear()
+        self._people_list = None
         self.current_person_index = 0
-        self.selected_dishes.clear()
+        self._dish_names.clear()
+        self._dish_index.clear()
+        self.selection.clear()
 
     def has_dishes(self) -> bool:
         """Check if any dishes have been added."""
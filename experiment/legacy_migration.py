@@ -0,0 +1,416 @@
+"""
+Migration of legacy bills_archive text files into a columnar store.
+Parses both the BillSplitterApp and the OutputManager bill layouts.
+
+Store layout:
+    checkpoint.json        file list, chunk size and completed chunks
+    chunk-NNNNNN/*.npy     one NumPy file per column for a chunk of bills
+
+Usage:
+    python legacy_migration.py ../bills_archive legacy_store --workers 4
+"""
+import argparse
+import datetime
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+CHECKPOINT_FILE = "checkpoint.json"
+# bill_YYYY-MM-DD_HH-MM-SS[-ffffff-NNN].txt; the suffix comes from OutputManager's bill IDs
+LEGACY_FILENAME = re.compile(r"^bill_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})(?:-(\d{6}))?")
+
+# BillSplitterApp.save_results_to_file layout
+APP_HEADER = "===== Bill Summary ====="
+APP_CREATED = re.compile(r"^Created: (\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})(?:-(\d{6}))?")
+APP_PERSON = re.compile(r"^(.+): THB (-?\d+(?:\.\d+)?)$")
+APP_TOTAL = re.compile(r"^Total Bill: (?:THB )?(-?\d+(?:\.\d+)?)(?: Baht)?$")
+
+# OutputManager.save_bill_to_file layout
+REPORT_HEADER = "BILL SUMMARY"
+REPORT_GENERATED = re.compile(r"^Generated: (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+REPORT_AMOUNT = re.compile(r"^(.+?)\.* THB\s+(-?\d+(?:\.\d+)?)$")
+REPORT_DISH = re.compile(r"^(.+) - THB (-?\d+(?:\.\d+)?)$")
+REPORT_SHARED = re.compile(r"^  Shared by: (.*)$")
+
+
+class ParsedBill(NamedTuple):
+    """One legacy bill file parsed into plain values."""
+    timestamp_ns: int
+    total_satang: int
+    person_amounts: List[Tuple[str, int]]
+    dishes: List[Tuple[str, int, List[str]]]
+
+
+def _satang(text: str) -> int:
+    return int(Decimal(text).scaleb(2))
+
+
+def _timestamp_ns(text: str, fmt: str, micros: Optional[str] = None) -> int:
+    seconds = int(datetime.datetime.strptime(text, fmt).timestamp())
+    return seconds * 1_000_000_000 + int(micros or 0) * 1000
+
+
+def parse_legacy_bill(path: str) -> ParsedBill:
+    """
+    Parse a legacy bill text file in either layout.
+
+    Args:
+        path: Path of a bill_*.txt file
+
+    Returns:
+        ParsedBill
+
+    Raises:
+        ValueError: If the file is not a recognised bill
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f]
+
+    timestamp_ns = None
+    match = LEGACY_FILENAME.match(os.path.basename(path))
+    if match:
+        timestamp_ns = _timestamp_ns(match.group(1), "%Y-%m-%d_%H-%M-%S", match.group(2))
+
+    try:
+        if APP_HEADER in lines[:2]:
+            bill = _parse_app_layout(lines, timestamp_ns)
+        elif REPORT_HEADER in lines[:3]:
+            bill = _parse_report_layout(lines, timestamp_ns)
+        else:
+            raise ValueError("Unrecognised bill layout")
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid amount: {e}")
+
+    if bill.timestamp_ns is None:
+        raise ValueError("No timestamp in file or filename")
+    return bill
+
+
+def _parse_app_layout(lines: List[str], timestamp_ns: Optional[int]) -> ParsedBill:
+    person_amounts = []
+    total = None
+    for line in lines:
+        match = APP_CREATED.match(line)
+        if match:
+            if timestamp_ns is None:
+                timestamp_ns = _timestamp_ns(match.group(1), "%Y-%m-%d_%H-%M-%S", match.group(2))
+            continue
+        match = APP_TOTAL.match(line)
+        if match:
+            total = _satang(match.group(1))
+            continue
+        match = APP_PERSON.match(line)
+        if match:
+            person_amounts.append((match.group(1), _satang(match.group(2))))
+
+    if total is None:
+        total = sum(amount for _, amount in person_amounts)
+    return ParsedBill(timestamp_ns, total, person_amounts, [])
+
+
+def _parse_report_layout(lines: List[str], timestamp_ns: Optional[int]) -> ParsedBill:
+    person_amounts = []
+    dishes = []
+    total = None
+    section = None
+    for line in lines:
+        if line == "INDIVIDUAL AMOUNTS:":
+            section = "people"
+            continue
+        if line == "DISH BREAKDOWN:":
+            section = "dishes"
+            continue
+        match = REPORT_GENERATED.match(line)
+        if match:
+            if timestamp_ns is None:
+                timestamp_ns = _timestamp_ns(match.group(1), "%Y-%m-%d %H:%M:%S")
+            continue
+
+        if section == "people":
+            match = REPORT_AMOUNT.match(line)
+            if not match:
+                continue
+            if match.group(1) == "TOTAL BILL":
+                total = _satang(match.group(2))
+                section = None
+            else:
+                person_amounts.append((match.group(1), _satang(match.group(2))))
+        elif section == "dishes":
+            match = REPORT_SHARED.match(line)
+            if match and dishes:
+                dishes[-1][2].extend(match.group(1).split(", "))
+                continue
+            match = REPORT_DISH.match(line)
+            if match:
+                dishes.append((match.group(1), _satang(match.group(2)), []))
+
+    if total is None:
+        total = sum(amount for _, amount in person_amounts)
+    return ParsedBill(timestamp_ns, total, person_amounts, dishes)
+
+
+def find_legacy_bills(directory: str) -> List[str]:
+    """Return the legacy bill file names in a directory, sorted."""
+    return sorted(
+        filename for filename in os.listdir(directory)
+        if filename.startswith("bill_") and filename.endswith(".txt")
+    )
+
+
+def chunk_dirname(chunk: int) -> str:
+    """Return the directory name of a chunk number."""
+    return f"chunk-{chunk:06d}"
+
+
+def migrate_chunk(
+    source_dir: str,
+    store_dir: str,
+    chunk: int,
+    first_bill_id: int,
+    filenames: List[str]
+) -> Tuple[int, List[Tuple[str, str]]]:
+    """
+    Parse one chunk of files and write its columns.
+
+    Columns are written to a temporary directory and renamed into place,
+    so a chunk is either fully present or absent after a crash.
+
+    Returns:
+        Tuple of (chunk number, list of (filename, error) for rejected files)
+    """
+    columns: Dict[str, list] = {
+        "bills_id": [], "bills_timestamp_ns": [], "bills_total_satang": [],
+        "bills_source": [],
+        "persons_bill_id": [], "persons_name": [], "persons_amount_satang": [],
+        "dishes_bill_id": [], "dishes_name": [], "dishes_price_satang": [],
+        "dishes_eater_count": [],
+        "eaters_dish_row": [], "eaters_name": [],
+    }
+    errors = []
+
+    for offset, filename in enumerate(filenames):
+        bill_id = first_bill_id + offset
+        try:
+            bill = parse_legacy_bill(os.path.join(source_dir, filename))
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            errors.append((filename, str(e)))
+            continue
+
+        columns["bills_id"].append(bill_id)
+        columns["bills_timestamp_ns"].append(bill.timestamp_ns)
+        columns["bills_total_satang"].append(bill.total_satang)
+        columns["bills_source"].append(filename)
+        for name, amount in bill.person_amounts:
+            columns["persons_bill_id"].append(bill_id)
+            columns["persons_name"].append(name)
+            columns["persons_amount_satang"].append(amount)
+        for name, price, eaters in bill.dishes:
+            dish_row = len(columns["dishes_bill_id"])
+            columns["dishes_bill_id"].append(bill_id)
+            columns["dishes_name"].append(name)
+            columns["dishes_price_satang"].append(price)
+            columns["dishes_eater_count"].append(len(eaters))
+            for eater_name in eaters:
+                columns["eaters_dish_row"].append(dish_row)
+                columns["eaters_name"].append(eater_name)
+
+    final_dir = os.path.join(store_dir, chunk_dirname(chunk))
+    temp_dir = final_dir + ".tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    for name, values in columns.items():
+        if name.endswith(("_name", "_source")):
+            array = np.array(values, dtype=str)
+        else:
+            array = np.array(values, dtype=np.int64)
+        np.save(os.path.join(temp_dir, name + ".npy"), array)
+    with open(os.path.join(temp_dir, "errors.json"), "w", encoding="utf-8") as f:
+        json.dump(errors, f)
+
+    shutil.rmtree(final_dir, ignore_errors=True)
+    os.replace(temp_dir, final_dir)
+    return chunk, errors
+
+
+class Checkpoint:
+    """Resumable migration state stored as JSON in the store directory."""
+
+    def __init__(self, store_dir: str):
+        self.path = os.path.join(store_dir, CHECKPOINT_FILE)
+        self.files: List[str] = []
+        self.chunk_size = 0
+        # chunk number -> number of files it was written from
+        self.done: Dict[int, int] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.files = data["files"]
+            self.chunk_size = data["chunk_size"]
+            self.done = {int(chunk): count for chunk, count in data["done"].items()}
+        except FileNotFoundError:
+            pass
+
+    def save(self) -> None:
+        """Atomically write the checkpoint."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"files": self.files, "chunk_size": self.chunk_size, "done": self.done},
+                f
+            )
+        os.replace(temp_path, self.path)
+
+
+def migrate(
+    source_dir: str,
+    store_dir: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000
+) -> List[Tuple[str, str]]:
+    """
+    Migrate every legacy bill in source_dir into the columnar store.
+
+    Already-completed chunks are skipped, so an interrupted run can be
+    resumed by running it again. Files that appeared since the last run
+    are appended as new chunks; existing bill IDs never change.
+
+    Args:
+        source_dir: Directory of legacy bill_*.txt files
+        store_dir: Output directory for the columnar store
+        workers: Number of worker processes (None uses all cores)
+        chunk_size: Bills per chunk (fixed by the first run)
+
+    Returns:
+        List of (filename, error) for files that could not be parsed
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    checkpoint = Checkpoint(store_dir)
+    if not checkpoint.chunk_size:
+        checkpoint.chunk_size = chunk_size
+
+    known = set(checkpoint.files)
+    checkpoint.files.extend(
+        filename for filename in find_legacy_bills(source_dir) if filename not in known
+    )
+    checkpoint.save()
+
+    size = checkpoint.chunk_size
+    chunk_count = (len(checkpoint.files) + size - 1) // size
+    # A chunk is redone if files were appended to it since it was written
+    pending = [
+        chunk for chunk in range(chunk_count)
+        if checkpoint.done.get(chunk) != len(checkpoint.files[chunk * size:(chunk + 1) * size])
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for chunk in pending:
+            filenames = checkpoint.files[chunk * size:(chunk + 1) * size]
+            future = executor.submit(
+                migrate_chunk, source_dir, store_dir, chunk, chunk * size, filenames
+            )
+            futures[future] = len(filenames)
+        for future in as_completed(futures):
+            chunk, _ = future.result()
+            checkpoint.done[chunk] = futures[future]
+            checkpoint.save()
+
+    # Report rejects from every chunk, including ones done by earlier runs
+    errors = []
+    for chunk in checkpoint.done:
+        path = os.path.join(store_dir, chunk_dirname(chunk), "errors.json")
+        with open(path, "r", encoding="utf-8") as f:
+            errors.extend(tuple(error) for error in json.load(f))
+    return sorted(errors)
+
+
+class LegacyStore:
+    """Loads a migrated columnar store back into flat NumPy columns."""
+
+    def __init__(self, store_dir: str):
+        checkpoint = Checkpoint(store_dir)
+        parts: Dict[str, List[np.ndarray]] = {}
+        for chunk in sorted(checkpoint.done):
+            chunk_dir = os.path.join(store_dir, chunk_dirname(chunk))
+            dish_offset = sum(len(a) for a in parts.get("dishes_bill_id", []))
+            for filename in sorted(os.listdir(chunk_dir)):
+                if not filename.endswith(".npy"):
+                    continue
+                column = np.load(os.path.join(chunk_dir, filename))
+                if filename == "eaters_dish_row.npy":
+                    column = column + dish_offset
+                parts.setdefault(filename[:-4], []).append(column)
+
+        columns = {
+            name: np.concatenate(arrays) if arrays else np.array([])
+            for name, arrays in parts.items()
+        }
+        self.bills = {k[6:]: v for k, v in columns.items() if k.startswith("bills_")}
+
+        # Person and dish names share one name table, like the binary archive
+        all_names = [
+            columns.get("persons_name", np.array([], dtype=str)),
+            columns.get("dishes_name", np.array([], dtype=str)),
+            columns.get("eaters_name", np.array([], dtype=str)),
+        ]
+        names, name_ids = np.unique(np.concatenate(all_names), return_inverse=True)
+        self.names: List[str] = names.tolist()
+        person_count = len(all_names[0])
+        dish_count = len(all_names[1])
+
+        # Chunks are loaded in order, so bill IDs are ascending and each
+        # row's bill is found by binary search
+        bill_ids = self.bills.get("id", np.empty(0, dtype=np.int64))
+        timestamps = self.bills.get("timestamp_ns", np.empty(0, dtype=np.int64))
+
+        def bill_timestamps(row_bill_ids: np.ndarray) -> np.ndarray:
+            return timestamps[np.searchsorted(bill_ids, row_bill_ids)]
+
+        persons_bill = columns.get("persons_bill_id", np.array([], dtype=np.int64))
+        self.persons = {
+            "timestamp_ns": bill_timestamps(persons_bill),
+            "bill_id": persons_bill,
+            "name_id": name_ids[:person_count],
+            "amount_satang": columns.get("persons_amount_satang", np.array([], dtype=np.int64)),
+        }
+        dishes_bill = columns.get("dishes_bill_id", np.array([], dtype=np.int64))
+        self.dishes = {
+            "timestamp_ns": bill_timestamps(dishes_bill),
+            "bill_id": dishes_bill,
+            "name_id": name_ids[person_count:person_count + dish_count],
+            "price_satang": columns.get("dishes_price_satang", np.array([], dtype=np.int64)),
+            "eater_count": columns.get("dishes_eater_count", np.array([], dtype=np.int64)),
+        }
+        self.eaters = {
+            "dish_row": columns.get("eaters_dish_row", np.array([], dtype=np.int64)),
+            "name_id": name_ids[person_count + dish_count:],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate legacy bill text files.")
+    parser.add_argument("source", help="Directory of bill_*.txt files")
+    parser.add_argument("store", help="Output directory for the columnar store")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    try:
+        errors = migrate(args.source, args.store, args.workers, args.chunk_size)
+    except OSError as e:
+        print(f"Error migrating bills: {e}")
+        return
+
+    print(f"Migration complete, {len(errors)} file(s) rejected")
+    for filename, error in errors:
+        print(f"  {filename}: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Columnar backing stores for large Bill Splitter sessions.
+Holds dishes and people in flat arrays and hands out lightweight row views
+that keep the Dish/Person property API.
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List
+from models import PERSON_IDS
+from split_strategies import EQUAL_SPLIT, SplitStrategy
+
+class DishRow:
+    """Read-only view of one row in a DishTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "DishTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._row]
+
+    @property
+    def price(self) -> float:
+        return self._table.prices[self._row]
+
+    @property
+    def eater_ids(self) -> array:
+        table = self._table
+        return table.eater_ids[table.offsets[self._row]:table.offsets[self._row + 1]]
+
+    @property
+    def eaters(self) -> list:
+        """List of people sharing this dish."""
+        name_of = PERSON_IDS.name_of
+        return [name_of(person_id) for person_id in self.eater_ids]
+
+    @property
+    def eater_count(self) -> int:
+        """Number of people sharing this dish."""
+        table = self._table
+        return table.offsets[self._row + 1] - table.offsets[self._row]
+
+    @property
+    def split_strategy(self) -> SplitStrategy:
+        """Table rows are always split equally."""
+        return EQUAL_SPLIT
+
+    def get_shares(self) -> Dict[str, float]:
+        """Return each eater's share of this dish."""
+        share = self.get_shared_price()
+        return {name: share for name in self.eaters}
+
+    def get_shared_price(self) -> float:
+        """Calculate the price per person for this dish."""
+        count = self.eater_count
+        if count == 0:
+            return 0.0
+        return self._table.prices[self._row] / count
+
+    def get_info(self) -> str:
+        """Return formatted dish information."""
+        return f"{self.name}: THB {self.price:.2f}"
+
+
+class DishTable:
+    """
+    Append-only columnar store of dishes.
+
+    Eaters are kept in CSR form: the eaters of row i are
+    eater_ids[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.prices = array("d")
+        self.offsets = array("q", [0])
+        self.eater_ids = array("l")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, name: str, price: float, eater_names: Iterable[str] = ()) -> DishRow:
+        """
+        Add a dish and its eaters to the table.
+
+        Args:
+            name: The dish name
+            price: The dish price
+            eater_names: Names of the people sharing the dish
+
+        Returns:
+            A view of the new row
+        """
+        intern = PERSON_IDS.intern
+        seen = set()
+        for eater_name in eater_names:
+            person_id = intern(eater_name)
+            if person_id not in seen:
+                seen.add(person_id)
+                self.eater_ids.append(person_id)
+        self.names.append(name)
+        self.prices.append(price)
+        self.offsets.append(len(self.eater_ids))
+        return DishRow(self, len(self.names) - 1)
+
+    def __iter__(self) -> Iterator[DishRow]:
+        for row in range(len(self.names)):
+            yield DishRow(self, row)
+
+    def as_dict(self) -> Dict[str, DishRow]:
+        """Return a name -> row view mapping usable wherever a dishes dict is expected."""
+        return {row.name: row for row in self}
+
+
+class PersonRow:
+    """Mutable view of one row in a PersonTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "PersonTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._row]
+
+    @property
+    def total(self) -> float:
+        return self._table.totals[self._row]
+
+    @property
+    def _total(self) -> float:
+        return self._table.totals[self._row]
+
+    @_total.setter
+    def _total(self, value: float) -> None:
+        self._table.totals[self._row] = value
+
+    def add_to_total(self, amount: float) -> None:
+        """Add an amount to this person's total bill."""
+        self._table.totals[self._row] += amount
+
+    def reset_total(self) -> None:
+        """Reset the person's total to zero."""
+        self._table.totals[self._row] = 0.0
+
+
+class PersonTable:
+    """Append-only columnar store of people and their totals."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.person_ids = array("l")
+        self.totals = array("d")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, name: str) -> PersonRow:
+        """Add a person to the table and return a view of the new row."""
+        name = name.strip()
+        person_id = PERSON_IDS.intern(name)
+        self.names.append(PERSON_IDS.name_of(person_id))
+        self.person_ids.append(person_id)
+        self.totals.append(0.0)
+        return PersonRow(self, len(self.names) - 1)
+
+    def __iter__(self) -> Iterator[PersonRow]:
+        for row in range(len(self.names)):
+            yield PersonRow(self, row)
+
+    def as_dict(self) -> Dict[str, PersonRow]:
+        """Return a name -> row view mapping usable wherever a people dict is expected."""
+        return {row.name: row for row in self}
+
+    def reset_totals(self) -> None:
+        """Zero every person's total in one pass over the column."""
+        self.totals = array("d", bytes(8 * len(self.names)))
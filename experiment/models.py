@@ -2,11 +2,47 @@
 Data models for the Bill Splitter application.
 Contains core business logic entities.
 """
+import sys
 from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+from split_strategies import EQUAL_SPLIT, SplitStrategy
+
+class PersonRegistry:
+    """Interns person names to small integer IDs shared by all dishes."""
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        """Return the ID for a name, registering it on first use."""
+        person_id = self._ids.get(name)
+        if person_id is None:
+            person_id = len(self._names)
+            name = sys.intern(name)
+            self._ids[name] = person_id
+            self._names.append(name)
+        return person_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the ID for a name, or None if it was never interned."""
+        return self._ids.get(name)
+
+    def name_of(self, person_id: int) -> str:
+        """Return the name registered for an ID."""
+        return self._names[person_id]
+
+
+PERSON_IDS = PersonRegistry()
+
 
 class MenuItem(ABC):
     """Abstract base class for menu items."""
-    
+
+    __slots__ = ("_name", "_price")
+
     def __init__(self, name: str, price: float):
         self._name = name
         self._price = price
@@ -27,26 +63,106 @@ class MenuItem(ABC):
 
 class Dish(MenuItem):
     """Represents a dish that can be shared among multiple people."""
-    
+
+    __slots__ = ("_eaters", "_eater_count", "_listeners", "_strategy")
+
     def __init__(self, name: str, price: float):
         super().__init__(name, price)
-        self._eaters = []
+        # Insertion-ordered set of person IDs (dict keys), giving O(1)
+        # add/remove/contains while keeping the "Shared by" order stable
+        self._eaters: Dict[int, None] = {}
+        self._eater_count = 0
+        self._listeners: Optional[List[Callable[["Dish"], None]]] = None
+        self._strategy: SplitStrategy = EQUAL_SPLIT
 
     @property
     def eaters(self) -> list:
         """List of people sharing this dish."""
-        return self._eaters
+        name_of = PERSON_IDS.name_of
+        return [name_of(person_id) for person_id in self._eaters]
+
+    @property
+    def eater_ids(self) -> List[int]:
+        """Interned IDs of the people sharing this dish."""
+        return list(self._eaters)
+
+    @property
+    def eater_count(self) -> int:
+        """Number of people sharing this dish."""
+        return self._eater_count
+
+    def has_eater(self, person_name: str) -> bool:
+        """Check whether a person shares this dish."""
+        person_id = PERSON_IDS.lookup(person_name)
+        return person_id is not None and person_id in self._eaters
 
     def add_eater(self, person_name: str) -> None:
-        """Add a person to the list of eaters for this dish."""
-        if person_name not in self._eaters:
-            self._eaters.append(person_name)
+        """
+        Add a person to the list of eaters for this dish.
+
+        Raises:
+            ValueError: If the dish's split strategy cannot include the person
+        """
+        person_id = PERSON_IDS.intern(person_name)
+        if person_id not in self._eaters:
+            if self._strategy is not EQUAL_SPLIT:
+                # Check before storing so a rejected eater leaves the dish unchanged
+                self._strategy.compile(self._price, self.eaters + [PERSON_IDS.name_of(person_id)])
+            self._eaters[person_id] = None
+            self._eater_count += 1
+            self._notify()
+
+    def remove_eater(self, person_name: str) -> None:
+        """Remove a person from the list of eaters for this dish."""
+        person_id = PERSON_IDS.lookup(person_name)
+        if person_id is not None and person_id in self._eaters:
+            del self._eaters[person_id]
+            self._eater_count -= 1
+            self._notify()
+
+    def subscribe(self, callback: Callable[["Dish"], None]) -> None:
+        """Register a callback invoked with this dish whenever its eaters change."""
+        if self._listeners is None:
+            self._listeners = []
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[["Dish"], None]) -> None:
+        """Stop notifying a previously registered callback."""
+        if self._listeners and callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self) -> None:
+        if self._listeners:
+            for callback in self._listeners:
+                callback(self)
+
+    @property
+    def split_strategy(self) -> SplitStrategy:
+        """Strategy deciding how the price is shared among eaters."""
+        return self._strategy
+
+    def set_split_strategy(self, strategy: SplitStrategy) -> None:
+        """
+        Change how this dish is split and notify listeners.
+
+        Raises:
+            ValueError: If the strategy cannot split this dish's price among its eaters
+        """
+        strategy.compile(self._price, self.eaters)
+        self._strategy = strategy
+        self._notify()
+
+    def get_shares(self) -> Dict[str, float]:
+        """Return each eater's share of this dish under its split strategy."""
+        eaters = self.eaters
+        return dict(zip(eaters, self._strategy.shares(self._price, eaters)))
 
     def get_shared_price(self) -> float:
-        """Calculate the price per person for this dish."""
-        if len(self._eaters) == 0:
+        """Calculate the equal price per person for this dish."""
+        if self._eater_count == 0:
             return 0.0
-        return self._price / len(self._eaters)
+        return self._price / self._eater_count
 
     def get_info(self) -> str:
         """Return formatted dish information."""
@@ -55,9 +171,11 @@ class Dish(MenuItem):
 
 class Person:
     """Represents a person participating in the bill split."""
-    
+
+    __slots__ = ("_name", "_total")
+
     def __init__(self, name: str):
-        self._name = name.strip()
+        self._name = sys.intern(name.strip())
         self._total = 0.0
 
     @property
@@ -74,4 +192,4 @@ class Person:
 
     def reset_total(self) -> None:
         """Reset the person's total to zero."""
-        self._total = 0.0
\ No newline at end of file
+        self._total = 0.0
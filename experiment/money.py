@@ -0,0 +1,108 @@
+"""
+Fixed-point money arithmetic for the Bill Splitter application.
+Amounts are held as integer satang (1 THB = 100 satang) so splits add up exactly.
+"""
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+from typing import Dict, Iterable, List, Sequence, Union
+
+SATANG_PER_BAHT = 100
+
+
+def to_satang(amount: float) -> int:
+    """
+    Convert a baht amount to integer satang, rounding half up.
+
+    Args:
+        amount: Amount in baht
+
+    Returns:
+        Amount in satang
+    """
+    return int(
+        Decimal(str(float(amount))).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    )
+
+
+def from_satang(satang: int) -> float:
+    """Convert integer satang back to a baht float for display."""
+    return satang / SATANG_PER_BAHT
+
+
+def allocate(total: int, weights: Sequence[Union[int, Fraction]]) -> List[int]:
+    """
+    Split an integer amount by exact weights using the largest-remainder rule.
+
+    Every part first gets the floor of its exact quota. The satang left over
+    go one each to the parts with the largest fractional remainders, ties
+    broken by position, so the result is deterministic and always sums to
+    total.
+
+    Args:
+        total: Amount in satang to split
+        weights: Non-negative int or Fraction weight for each part
+
+    Returns:
+        List of satang amounts, one per weight
+    """
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        return [0] * len(weights)
+
+    shares = []
+    remainders = []
+    for weight in weights:
+        quota, remainder = divmod(total * weight, weight_sum)
+        shares.append(int(quota))
+        remainders.append(remainder)
+
+    leftover = total - sum(shares)
+    if leftover:
+        order = sorted(range(len(weights)), key=lambda i: (-remainders[i], i))
+        for i in order[:leftover]:
+            shares[i] += 1
+    return shares
+
+
+def split_evenly(total: int, parts: int) -> List[int]:
+    """
+    Split an integer amount into equal parts, the first ones taking the extra satang.
+
+    Equivalent to allocate(total, [1] * parts) without building the weights.
+    """
+    if parts <= 0:
+        return []
+    base, leftover = divmod(total, parts)
+    return [base + 1] * leftover + [base] * (parts - leftover)
+
+
+class SatangLedger:
+    """Compact per-person satang totals with running bill and allocation sums."""
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(names)
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.totals = array("q", bytes(8 * len(self.names)))
+        self.billed = 0
+        self.allocated = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def add_bill_amount(self, satang: int) -> None:
+        """Record an amount that has been charged on the bill."""
+        self.billed += satang
+
+    def add(self, name: str, satang: int) -> None:
+        """Credit an allocated amount to a person."""
+        self.totals[self._index[name]] += satang
+        self.allocated += satang
+
+    def get(self, name: str) -> int:
+        """Return a person's total in satang."""
+        return self.totals[self._index[name]]
+
+    def is_balanced(self) -> bool:
+        """Check that everything billed has been allocated, in O(1)."""
+        return self.billed == self.allocated
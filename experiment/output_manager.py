@@ -3,9 +3,142 @@ Output management for the Bill Splitter application.
 Handles file generation and result formatting.
 """
 import datetime
+import io
 import os
-from typing import Dict, Optional
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional, TextIO, Tuple
 from models import Dish, Person
+from bill_calculator import BillCalculator
+from money import from_satang
+
+class BillIdGenerator:
+    """
+    Issues unique, sortable bill IDs: local time to the microsecond plus a sequence.
+
+    IDs never repeat or go backwards within a process, even when several
+    bills are saved in the same microsecond or the wall clock steps back.
+    Once the three-digit sequence is used up, the next ID moves on to the
+    following microsecond, so every ID keeps the same width.
+    """
+
+    MAX_SEQUENCE = 999
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_us = 0
+        self._sequence = 0
+
+    def next_id(self) -> str:
+        """
+        Return the next bill ID.
+
+        Returns:
+            ID string in format: YYYY-MM-DD_HH-MM-SS-ffffff-NNN
+        """
+        with self._lock:
+            now_us = time.time_ns() // 1000
+            if now_us > self._last_us:
+                self._last_us = now_us
+                self._sequence = 0
+            elif self._sequence < self.MAX_SEQUENCE:
+                self._sequence += 1
+            else:
+                self._last_us += 1
+                self._sequence = 0
+            seconds, micros = divmod(self._last_us, 1_000_000)
+            sequence = self._sequence
+        stamp = datetime.datetime.fromtimestamp(seconds).strftime("%Y-%m-%d_%H-%M-%S")
+        return f"{stamp}-{micros:06d}-{sequence:03d}"
+
+
+BILL_IDS = BillIdGenerator()
+
+
+class BillReportWriter:
+    """
+    Streams a bill report to any text stream in one pass.
+    
+    Lines are produced by a generator over the pre-computed summary and
+    flushed to the stream in fixed-size chunks, so memory use stays
+    constant however many people and dishes the bill has.
+    """
+    
+    RULE = "=" * 50
+    THIN_RULE = "-" * 50
+    
+    def __init__(self, stream: TextIO, chunk_lines: int = 1024):
+        self.stream = stream
+        self.chunk_lines = chunk_lines
+
+    def write_report(
+        self,
+        person_amounts: Iterable[Tuple[str, float]],
+        total_bill: float,
+        dishes: Iterable[Dish],
+        timestamp: Optional[str] = None
+    ) -> None:
+        """
+        Write the full report.
+        
+        Args:
+            person_amounts: (person_name, amount) tuples from BillCalculator.get_bill_summary
+            total_bill: Total bill amount
+            dishes: Dishes for the breakdown section
+            timestamp: Generated time to print. If None, uses the current time
+        """
+        if timestamp is None:
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        write = self.stream.write
+        chunk = []
+        for line in self._iter_lines(person_amounts, total_bill, dishes, timestamp):
+            chunk.append(line)
+            if len(chunk) >= self.chunk_lines:
+                write("".join(chunk))
+                chunk.clear()
+        if chunk:
+            write("".join(chunk))
+
+    def _iter_lines(
+        self,
+        person_amounts: Iterable[Tuple[str, float]],
+        total_bill: float,
+        dishes: Iterable[Dish],
+        timestamp: str
+    ) -> Iterator[str]:
+        """Yield the report line by line."""
+        yield f"{self.RULE}\nBILL SUMMARY\n{self.RULE}\n"
+        yield f"Generated: {timestamp}\n\n"
+        
+        # Individual totals
+        yield f"INDIVIDUAL AMOUNTS:\n{self.THIN_RULE}\n"
+        for name, amount in person_amounts:
+            yield f"{name:.<40} THB {amount:>8.2f}\n"
+        
+        # Total
+        yield f"{self.THIN_RULE}\n"
+        yield f"{'TOTAL BILL':.<40} THB {total_bill:>8.2f}\n"
+        yield f"{self.RULE}\n\n"
+        
+        # Dish breakdown
+        yield f"DISH BREAKDOWN:\n{self.THIN_RULE}\n"
+        for dish in dishes:
+            yield f"\n{dish.name} - THB {dish.price:.2f}\n"
+            if dish.eater_count:
+                yield f"  Shared by: {', '.join(dish.eaters)}\n"
+                # Exact satang shares, so the lines add up to the dish price
+                shares = BillCalculator.get_dish_shares_exact(dish)
+                if len(set(shares.values())) == 1:
+                    yield f"  Per person: THB {from_satang(next(iter(shares.values()))):.2f}\n"
+                else:
+                    for name, share in shares.items():
+                        yield f"  {name}: THB {from_satang(share):.2f}\n"
+            else:
+                yield "  Not assigned to anyone\n"
+        
+        yield f"\n{self.RULE}\n"
+
 
 class OutputManager:
     """Manages output generation and file operations."""
@@ -13,14 +146,12 @@ class OutputManager:
     @staticmethod
     def generate_filename() -> str:
         """
-        Generate a timestamped filename for the bill.
+        Generate a unique, timestamped filename for the bill.
         
         Returns:
-            Filename string in format: bill_YYYY-MM-DD_HH-MM-SS.txt
+            Filename string in format: bill_YYYY-MM-DD_HH-MM-SS-ffffff-NNN.txt
         """
-        now = datetime.datetime.now()
-        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
-        return f"bill_{timestamp}.txt"
+        return f"bill_{BILL_IDS.next_id()}.txt"
 
     @staticmethod
     def save_bill_to_file(
@@ -34,49 +165,26 @@ class OutputManager:
         Args:
             dishes: Dictionary of dish names to Dish objects
             people: Dictionary of person names to Person objects
-            filename: Optional custom filename. If None, generates timestamped filename
+            filename: Optional custom filename, overwritten if it exists.
+                If None, generates a timestamped filename that is never overwritten
             
         Returns:
             The filename if successful, None if failed
         """
+        # "x" refuses to overwrite an existing bill with a generated name
+        mode = "w"
         if filename is None:
             filename = OutputManager.generate_filename()
+            mode = "x"
         
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                # Write header
-                f.write("=" * 50 + "\n")
-                f.write("BILL SUMMARY\n")
-                f.write("=" * 50 + "\n")
-                
-                now = datetime.datetime.now()
-                timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"Generated: {timestamp}\n\n")
-                
-                # Write individual totals
-                f.write("INDIVIDUAL AMOUNTS:\n")
-                f.write("-" * 50 + "\n")
-                for person in people.values():
-                    f.write(f"{person.name:.<40} THB {person.total:>8.2f}\n")
-                
-                # Write total
-                total_bill = sum(dish.price for dish in dishes.values())
-                f.write("-" * 50 + "\n")
-                f.write(f"{'TOTAL BILL':.<40} THB {total_bill:>8.2f}\n")
-                f.write("=" * 50 + "\n\n")
-                
-                # Write dish breakdown
-                f.write("DISH BREAKDOWN:\n")
-                f.write("-" * 50 + "\n")
-                for dish in dishes.values():
-                    f.write(f"\n{dish.name} - THB {dish.price:.2f}\n")
-                    if dish.eaters:
-                        f.write(f"  Shared by: {', '.join(dish.eaters)}\n")
-                        f.write(f"  Per person: THB {dish.get_shared_price():.2f}\n")
-                    else:
-                        f.write("  Not assigned to anyone\n")
-                
-                f.write("\n" + "=" * 50 + "\n")
+            person_amounts, total_bill = BillCalculator.get_bill_summary(dishes, people)
+            with open(filename, mode, encoding="utf-8") as f:
+                BillReportWriter(f).write_report(
+                    person_amounts,
+                    total_bill,
+                    dishes.values()
+                )
             
             print(f"Bill successfully saved to: {filename}")
             return filename
@@ -85,6 +193,48 @@ class OutputManager:
             print(f"Error saving bill to file: {e}")
             return None
 
+    @staticmethod
+    def render_bill(dishes: Dict[str, Dish], people: Dict[str, Person]) -> str:
+        """
+        Render the bill summary to a string instead of a file.
+        
+        Args:
+            dishes: Dictionary of dish names to Dish objects
+            people: Dictionary of person names to Person objects
+            
+        Returns:
+            The report text, identical to what save_bill_to_file writes
+        """
+        person_amounts, total_bill = BillCalculator.get_bill_summary(dishes, people)
+        buffer = io.StringIO()
+        BillReportWriter(buffer).write_report(person_amounts, total_bill, dishes.values())
+        return buffer.getvalue()
+
+    @staticmethod
+    def save_text_to_file(text: str, filename: str, exclusive: bool = False) -> Optional[str]:
+        """
+        Write an already rendered bill to a file.
+
+        Safe to call from a background thread; pairs with render_bill.
+
+        Args:
+            text: Report text, e.g. from render_bill
+            filename: Destination filename
+            exclusive: Fail instead of overwriting if filename already exists,
+                e.g. for a name from generate_filename
+
+        Returns:
+            The filename if successful, None if failed
+        """
+        try:
+            with open(filename, "x" if exclusive else "w", encoding="utf-8") as f:
+                f.write(text)
+            print(f"Bill successfully saved to: {filename}")
+            return filename
+        except OSError as e:
+            print(f"Error saving bill to file: {e}")
+            return None
+
     @staticmethod
     def get_file_absolute_path(filename: str) -> Optional[str]:
         """
@@ -127,4 +277,4 @@ class OutputManager:
         Returns:
             Formatted string
         """
-        return f"{name}: {OutputManager.format_currency(amount)}"
\ No newline at end of file
+        return f"{name}: {OutputManager.format_currency(amount)}"
@@ -0,0 +1,106 @@
+"""
+Dish selection model for the Bill Splitter application.
+Tracks which dishes are selected as a flag per dish index.
+"""
+from typing import Dict, Iterable, Iterator, List
+
+_INVERT_TABLE = bytes([1, 0]) + bytes(254)
+
+
+class DishSelection:
+    """
+    Set of selected dishes stored as one flag byte per dish index.
+
+    Membership and toggles are O(1), iteration follows menu order, and
+    bulk operations (select all, clear, invert) are single C-level calls
+    on the flag buffer rather than per-dish Python loops.
+    """
+
+    def __init__(self, dish_names: List[str], dish_index: Dict[str, int]):
+        self._names = dish_names
+        self._index = dish_index
+        self._flags = bytearray()
+        self._count = 0
+
+    def _sync(self) -> None:
+        """Resize the flag buffer to match the dish list, which may have grown or been cleared."""
+        missing = len(self._names) - len(self._flags)
+        if missing > 0:
+            self._flags.extend(bytes(missing))
+        elif missing < 0:
+            del self._flags[len(self._names):]
+            self._count = self._flags.count(1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, dish_name: str) -> bool:
+        i = self._index.get(dish_name)
+        return i is not None and i < len(self._flags) and self._flags[i] == 1
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield selected dish names in menu order."""
+        self._sync()
+        flags = self._flags
+        names = self._names
+        i = flags.find(1)
+        while i != -1:
+            yield names[i]
+            i = flags.find(1, i + 1)
+
+    def select(self, dish_name: str) -> None:
+        """Select a dish if it exists and is not already selected."""
+        i = self._index.get(dish_name)
+        if i is None:
+            return
+        self._sync()
+        if not self._flags[i]:
+            self._flags[i] = 1
+            self._count += 1
+
+    def deselect(self, dish_name: str) -> None:
+        """Deselect a dish if it is selected."""
+        i = self._index.get(dish_name)
+        if i is not None and i < len(self._flags) and self._flags[i]:
+            self._flags[i] = 0
+            self._count -= 1
+
+    def toggle(self, dish_name: str) -> None:
+        """Toggle the selection state of a dish."""
+        if dish_name in self:
+            self.deselect(dish_name)
+        else:
+            self.select(dish_name)
+
+    def update(self, dish_names: Iterable[str]) -> None:
+        """Select several dishes at once."""
+        self._sync()
+        flags = self._flags
+        index = self._index
+        for dish_name in dish_names:
+            i = index.get(dish_name)
+            if i is not None and not flags[i]:
+                flags[i] = 1
+                self._count += 1
+
+    def select_all(self) -> None:
+        """Select every dish."""
+        self._flags = bytearray(b"\x01") * len(self._names)
+        self._count = len(self._names)
+
+    def clear(self) -> None:
+        """Deselect every dish."""
+        self._flags = bytearray(len(self._names))
+        self._count = 0
+
+    def invert(self) -> None:
+        """Select exactly the dishes that are not currently selected."""
+        self._sync()
+        self._flags = self._flags.translate(_INVERT_TABLE)
+        self._count = len(self._flags) - self._count
+
+    def set_flags(self, flags: Iterable[bool]) -> None:
+        """Replace the whole selection with one flag per dish, in menu order."""
+        self._flags = bytearray(1 if flag else 0 for flag in flags)
+        self._sync()
+        self._count = self._flags.count(1)
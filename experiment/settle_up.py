@@ -0,0 +1,119 @@
+"""
+Settle-up for the Bill Splitter application.
+Turns who paid and who owes into a short list of transfers.
+"""
+import heapq
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Tuple
+from models import Dish, Person
+from bill_calculator import BillCalculator
+from money import to_satang, from_satang
+
+class Transfer(NamedTuple):
+    """A single payment from one person to another."""
+    payer: str
+    payee: str
+    amount: float
+
+
+def compute_balances(
+    person_amounts: List[Tuple[str, float]],
+    contributions: Dict[str, float]
+) -> Dict[str, int]:
+    """
+    Work out each person's net balance in satang.
+
+    Positive balances are owed money, negative balances owe money.
+
+    Args:
+        person_amounts: List of (person_name, amount owed) tuples
+        contributions: Dictionary of person name to amount they actually paid
+
+    Returns:
+        Dictionary of person name to balance in satang
+    """
+    balances: Dict[str, int] = {}
+    for name, amount in person_amounts:
+        balances[name] = balances.get(name, 0) - to_satang(amount)
+    for name, paid in contributions.items():
+        balances[name] = balances.get(name, 0) + to_satang(paid)
+    return balances
+
+
+def settle_balances(balances: Dict[str, int]) -> List[Transfer]:
+    """
+    Produce a near-minimal list of transfers that clears all balances.
+
+    Debtors and creditors whose balances cancel exactly are paired first,
+    since each such pair clears two people with one transfer. The rest is
+    settled greedily with two max-heaps: the largest debtor pays the
+    largest creditor, and whoever has money left goes back on the heap.
+    This takes O(n log n) and uses at most n - 1 transfers.
+
+    If the balances do not sum to zero, the leftover stays unsettled.
+
+    Args:
+        balances: Dictionary of person name to balance in satang
+
+    Returns:
+        List of Transfer tuples
+    """
+    transfers: List[Transfer] = []
+
+    # Pair exact matches first, in name order so the result is deterministic
+    creditors_by_amount: Dict[int, Deque[str]] = {}
+    for name in sorted(balances):
+        if balances[name] > 0:
+            creditors_by_amount.setdefault(balances[name], deque()).append(name)
+
+    debtors: List[Tuple[int, str]] = []
+    for name in sorted(balances):
+        debt = -balances[name]
+        if debt <= 0:
+            continue
+        matches = creditors_by_amount.get(debt)
+        if matches:
+            transfers.append(Transfer(name, matches.popleft(), from_satang(debt)))
+        else:
+            debtors.append((-debt, name))
+
+    creditors = [
+        (-amount, name)
+        for amount, names in creditors_by_amount.items()
+        for name in names
+    ]
+    heapq.heapify(debtors)
+    heapq.heapify(creditors)
+
+    while debtors and creditors:
+        negative_debt, debtor = heapq.heappop(debtors)
+        negative_credit, creditor = heapq.heappop(creditors)
+        amount = min(-negative_debt, -negative_credit)
+        transfers.append(Transfer(debtor, creditor, from_satang(amount)))
+
+        if -negative_debt > amount:
+            heapq.heappush(debtors, (negative_debt + amount, debtor))
+        if -negative_credit > amount:
+            heapq.heappush(creditors, (negative_credit + amount, creditor))
+
+    return transfers
+
+
+def settle_up(
+    dishes: Dict[str, Dish],
+    people: Dict[str, Person],
+    contributions: Dict[str, float]
+) -> List[Transfer]:
+    """
+    Work out who pays whom after bills have been calculated.
+
+    Args:
+        dishes: Dictionary of dish names to Dish objects
+        people: Dictionary of person names to Person objects
+        contributions: Dictionary of person name to amount they actually paid
+
+    Returns:
+        List of Transfer tuples
+    """
+    person_amounts, _ = BillCalculator.get_bill_summary(dishes, people)
+    return settle_balances(compute_balances(person_amounts, contributions))
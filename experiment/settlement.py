@@ -0,0 +1,177 @@
+"""
+Multi-process settlement of bill batches for the Bill Splitter application.
+Re-calculates and validates a directory of bills and merges per-person totals.
+
+Each bill is a JSON file:
+    {
+        "dishes": [{"name": "Pad Thai", "price": 120.0, "eaters": ["Karn", "Fay"]}],
+        "people": ["Karn", "Fay"]
+    }
+
+Usage:
+    python settlement.py bills_dir --workers 4
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from models import Dish, Person
+from bill_calculator import BillCalculator
+from money import from_satang
+
+BILL_EXTENSION = ".json"
+
+
+def _string_list(value, field: str) -> List[str]:
+    """Return value if it is a list of strings, else raise ValueError."""
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"'{field}' must be a list of names")
+    return value
+
+
+def load_bill(path: str) -> Tuple[Dict[str, Dish], Dict[str, Person]]:
+    """
+    Load a bill JSON file into dishes and people dictionaries.
+
+    Args:
+        path: Path of the bill file
+
+    Returns:
+        Tuple of (dishes, people)
+
+    Raises:
+        ValueError: If the file is not shaped like a bill
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("Bill must be a JSON object")
+
+    people = {}
+    for name in _string_list(data.get("people", []), "people"):
+        person = Person(name)
+        people[person.name] = person
+
+    dishes = {}
+    rows = data.get("dishes", [])
+    if not isinstance(rows, list):
+        raise ValueError("'dishes' must be a list")
+    for row in rows:
+        if not isinstance(row, dict) or not isinstance(row.get("name"), str):
+            raise ValueError(f"Invalid dish: {row!r}")
+        dish = Dish(row["name"], float(row["price"]))
+        for eater_name in _string_list(row.get("eaters", []), "eaters"):
+            dish.add_eater(eater_name)
+        dishes[dish.name] = dish
+
+    return dishes, people
+
+
+def settle_bill(path: str) -> Tuple[str, bool, str, List[Tuple[str, int]]]:
+    """
+    Calculate and validate a single bill file.
+
+    Runs in a worker process, so it returns plain data only.
+
+    Returns:
+        Tuple of (path, is_valid, error_message, list of (person_name, satang))
+    """
+    try:
+        dishes, people = load_bill(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return path, False, f"Cannot read bill: {e}", []
+
+    ledger = BillCalculator.calculate_bills_exact(dishes, people)
+    is_valid, error = BillCalculator.validate_bill_split(dishes, people)
+    if is_valid:
+        is_valid, error = BillCalculator.validate_ledger(ledger)
+    return path, is_valid, error, [(name, ledger.get(name)) for name in ledger.names]
+
+
+def find_bills(directory: str) -> List[str]:
+    """Return the bill files in a directory, sorted by name."""
+    return sorted(
+        os.path.join(directory, filename)
+        for filename in os.listdir(directory)
+        if filename.endswith(BILL_EXTENSION)
+    )
+
+
+class SettlementResult:
+    """Merged outcome of settling a batch of bills."""
+
+    def __init__(self):
+        self.totals: Dict[str, int] = {}
+        self.settled: List[str] = []
+        self.errors: List[Tuple[str, str]] = []
+
+    def merge(self, path: str, is_valid: bool, error: str, amounts: List[Tuple[str, int]]) -> None:
+        """Fold one bill's result into the running totals."""
+        if not is_valid:
+            self.errors.append((path, error))
+            return
+        self.settled.append(path)
+        for name, satang in amounts:
+            self.totals[name] = self.totals.get(name, 0) + satang
+
+    def get_person_totals(self) -> List[Tuple[str, float]]:
+        """Return (person_name, amount) tuples sorted by name."""
+        return [(name, from_satang(self.totals[name])) for name in sorted(self.totals)]
+
+
+def settle_directory(
+    directory: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16
+) -> SettlementResult:
+    """
+    Settle every bill in a directory across a pool of worker processes.
+
+    Bills are processed in filename order and merged in that same order,
+    so the result does not depend on how work was scheduled.
+
+    Args:
+        directory: Directory containing bill JSON files
+        workers: Number of worker processes (None uses all cores, 1 runs in-process)
+        chunksize: Number of bills handed to a worker at a time
+
+    Returns:
+        SettlementResult with merged totals and any rejected bills
+    """
+    paths = find_bills(directory)
+    result = SettlementResult()
+
+    if workers == 1:
+        for outcome in map(settle_bill, paths):
+            result.merge(*outcome)
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for outcome in executor.map(settle_bill, paths, chunksize=chunksize):
+            result.merge(*outcome)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Settle a directory of bills.")
+    parser.add_argument("directory", help="Directory of bill JSON files")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    try:
+        result = settle_directory(args.directory, args.workers)
+    except OSError as e:
+        print(f"Error reading bills directory: {e}")
+        return
+
+    for name, amount in result.get_person_totals():
+        print(f"{name:.<40} THB {amount:>10.2f}")
+    print(f"\nSettled {len(result.settled)} bill(s), rejected {len(result.errors)}")
+    for path, error in result.errors:
+        print(f"  {path}: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Precompiled split plans for the Bill Splitter application.
+Turns a bill's dish strategies into flat arrays evaluated in one vectorized pass.
+"""
+from typing import Dict, List
+import numpy as np
+
+class SplitPlan:
+    """
+    Flat, precompiled representation of how a bill is split.
+
+    Compile once per bill; apply() then computes every person's total
+    with a handful of array operations regardless of the strategy mix.
+    """
+
+    def __init__(
+        self,
+        person_names: List[str],
+        prices: np.ndarray,
+        entry_dish: np.ndarray,
+        entry_person: np.ndarray,
+        entry_fixed: np.ndarray,
+        entry_weight: np.ndarray
+    ):
+        self.person_names = person_names
+        self.prices = prices
+        self.entry_dish = entry_dish
+        self.entry_person = entry_person
+        self.entry_fixed = entry_fixed
+        self.entry_weight = entry_weight
+
+    @staticmethod
+    def compile(dishes: Dict, people: Dict) -> "SplitPlan":
+        """
+        Compile every dish's strategy into one set of flat arrays.
+
+        Eaters missing from people still take part in the split (their
+        share is simply not credited to anyone), matching BillCalculator.
+
+        Args:
+            dishes: Dictionary of dish names to Dish objects
+            people: Dictionary of person names to Person objects
+
+        Returns:
+            The compiled SplitPlan
+        """
+        person_names = list(people)
+        person_index = {name: i for i, name in enumerate(person_names)}
+
+        prices = []
+        entry_dish = []
+        entry_person = []
+        entry_fixed = []
+        entry_weight = []
+        for dish_number, dish in enumerate(dishes.values()):
+            eaters = dish.eaters
+            prices.append(dish.price)
+            fixed, weights = dish.split_strategy.compile(dish.price, eaters)
+            entry_dish.extend([dish_number] * len(eaters))
+            entry_person.extend(person_index.get(name, -1) for name in eaters)
+            entry_fixed.extend(fixed)
+            entry_weight.extend(weights)
+
+        return SplitPlan(
+            person_names,
+            np.asarray(prices, dtype=np.float64),
+            np.asarray(entry_dish, dtype=np.intp),
+            np.asarray(entry_person, dtype=np.intp),
+            np.asarray(entry_fixed, dtype=np.float64),
+            np.asarray(entry_weight, dtype=np.float64)
+        )
+
+    def entry_shares(self) -> np.ndarray:
+        """Return the share of every (dish, eater) entry."""
+        dish_count = len(self.prices)
+        fixed_sum = np.bincount(self.entry_dish, weights=self.entry_fixed, minlength=dish_count)
+        weight_sum = np.bincount(self.entry_dish, weights=self.entry_weight, minlength=dish_count)
+        per_weight = np.divide(
+            self.prices - fixed_sum,
+            weight_sum,
+            out=np.zeros(dish_count),
+            where=weight_sum > 0
+        )
+        return self.entry_fixed + self.entry_weight * per_weight[self.entry_dish]
+
+    def totals(self) -> np.ndarray:
+        """Return every person's total, in the order of the people dictionary."""
+        known = self.entry_person >= 0
+        return np.bincount(
+            self.entry_person[known],
+            weights=self.entry_shares()[known],
+            minlength=len(self.person_names)
+        )
+
+    def apply(self, people: Dict) -> None:
+        """Write the computed totals onto the Person objects."""
+        for name, total in zip(self.person_names, self.totals().tolist()):
+            people[name]._total = total
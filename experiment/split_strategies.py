@@ -0,0 +1,120 @@
+"""
+Split strategies for the Bill Splitter application.
+Decide how a dish's price is shared among its eaters.
+
+Every strategy compiles a dish into a fixed amount and a weight per eater:
+
+    share = fixed + weight / sum(weights) * (price - sum(fixed))
+
+so a whole bill with mixed strategies reduces to flat arrays that
+split_plan.SplitPlan evaluates in one vectorized pass. A dish with eaters
+always compiles to weights with a positive sum, so the residual is never
+dropped: when no eater has weight, it is spread equally.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Tuple
+from money import to_satang
+
+class SplitStrategy(ABC):
+    """Abstract base class for split strategies."""
+
+    @abstractmethod
+    def compile(self, price: float, eaters: Sequence[str]) -> Tuple[List[float], List[float]]:
+        """
+        Compile a dish into per-eater fixed amounts and weights.
+
+        Args:
+            price: The dish price
+            eaters: Names of the people sharing the dish, in order
+
+        Returns:
+            Tuple of (fixed amounts, weights), one entry per eater
+        """
+        pass
+
+    def shares(self, price: float, eaters: Sequence[str]) -> List[float]:
+        """Return each eater's share of the price."""
+        fixed, weights = self.compile(price, eaters)
+        weight_sum = sum(weights)
+        residual = price - sum(fixed)
+        if weight_sum <= 0:
+            return list(fixed)
+        return [f + w / weight_sum * residual for f, w in zip(fixed, weights)]
+
+
+class EqualSplit(SplitStrategy):
+    """Everybody pays the same share."""
+
+    def compile(self, price: float, eaters: Sequence[str]) -> Tuple[List[float], List[float]]:
+        return [0.0] * len(eaters), [1.0] * len(eaters)
+
+
+def _spread_if_unweighted(weights: List[float]) -> List[float]:
+    """Weigh every eater equally when none has a positive weight."""
+    return weights if any(weights) else [1.0] * len(weights)
+
+
+class WeightedSplit(SplitStrategy):
+    """
+    Shares proportional to a weight per person, e.g. 0.5 for kids.
+
+    Raises ValueError for a negative weight. If every eater of a dish
+    has weight 0, they split it equally.
+    """
+
+    def __init__(self, weights: Dict[str, float], default_weight: float = 1.0):
+        for name, weight in weights.items():
+            if weight < 0:
+                raise ValueError(f"Weight for {name} cannot be negative")
+        if default_weight < 0:
+            raise ValueError("Default weight cannot be negative")
+        self.weights = dict(weights)
+        self.default_weight = default_weight
+
+    def compile(self, price: float, eaters: Sequence[str]) -> Tuple[List[float], List[float]]:
+        get = self.weights.get
+        default = self.default_weight
+        weights = [float(get(name, default)) for name in eaters]
+        return [0.0] * len(eaters), _spread_if_unweighted(weights)
+
+
+class QuantitySplit(WeightedSplit):
+    """Shares proportional to how many portions each person had."""
+
+    def __init__(self, quantities: Dict[str, int]):
+        super().__init__(quantities, default_weight=1)
+
+
+class FixedAmountSplit(SplitStrategy):
+    """
+    Listed people pay a fixed amount; everyone else splits the rest equally.
+    If every eater is listed, whatever their amounts leave of the price
+    is split equally among them on top.
+
+    Raises ValueError for a negative amount, or when the fixed amounts of
+    a dish's eaters add up to more than its price.
+    """
+
+    def __init__(self, amounts: Dict[str, float]):
+        for name, amount in amounts.items():
+            if amount < 0:
+                raise ValueError(f"Fixed amount for {name} cannot be negative")
+        self.amounts = dict(amounts)
+
+    def compile(self, price: float, eaters: Sequence[str]) -> Tuple[List[float], List[float]]:
+        fixed_total = sum(to_satang(self.amounts[name]) for name in eaters if name in self.amounts)
+        if fixed_total > to_satang(price):
+            raise ValueError("Fixed amounts add up to more than the dish price")
+        fixed = []
+        weights = []
+        for name in eaters:
+            if name in self.amounts:
+                fixed.append(float(self.amounts[name]))
+                weights.append(0.0)
+            else:
+                fixed.append(0.0)
+                weights.append(1.0)
+        return fixed, _spread_if_unweighted(weights)
+
+
+EQUAL_SPLIT = EqualSplit()
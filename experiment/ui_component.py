@@ -4,6 +4,8 @@ Contains reusable interface elements.
 """
 import pygame
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence
 from constants import *
 
 def safe_draw(func):
@@ -16,12 +18,92 @@ def safe_draw(func):
     return wrapper
 
 
+class TextCache:
+    """
+    Bounded LRU cache of rendered text surfaces.
+
+    Keyed by (font, text, color, antialias), so unchanged text is
+    rasterized once instead of on every frame.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        """Return the surface for the text, rendering it only on a cache miss."""
+        if isinstance(color, pygame.Color):
+            color = tuple(color)
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+TEXT_CACHE = TextCache()
+
+
+class FontRegistry:
+    """
+    Process-wide pygame fonts keyed by (path, size).
+
+    Each font file is opened and parsed once; every component and
+    screen asking for the same path and size shares one Font object,
+    which also lets TEXT_CACHE hits carry across components.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, size: int, path: str = None) -> pygame.font.Font:
+        """Return the font for (path, size), loading it on first use. None is the default font."""
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self) -> None:
+        """Forget every loaded font, e.g. after pygame.font.quit()."""
+        self._fonts.clear()
+
+
+FONTS = FontRegistry()
+
+
+def get_font(size: int, path: str = None) -> pygame.font.Font:
+    """Shortcut for FONTS.get."""
+    return FONTS.get(size, path)
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+    """Drop-in replacement for font.render that goes through TEXT_CACHE."""
+    return TEXT_CACHE.render(font, text, antialias, color)
+
+
 class UIComponent(ABC):
     """Abstract base class for UI components."""
     
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = pygame.Rect(x, y, width, height)
         self.visible = True
+        # Set when the component's look changed and its rect needs repainting
+        self.dirty = True
 
     @abstractmethod
     def draw(self, surface: pygame.Surface) -> None:
@@ -58,7 +140,7 @@ class Button(UIComponent):
         self.hover_color = LIGHT_BLUE
         self.text_color = text_color
         self.hovered = False
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(32)
 
     @safe_draw
     def draw(self, surface: pygame.Surface) -> None:
@@ -67,14 +149,17 @@ class Button(UIComponent):
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
         pygame.draw.rect(surface, DARK_GRAY, self.rect, 2, border_radius=8)
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse hover and click events."""
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.dirty = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 return True
@@ -98,7 +183,7 @@ class InputBox(UIComponent):
         self.placeholder = placeholder
         self.active = False
         self.numeric_only = numeric_only
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(32)
         self.color_inactive = GRAY
         self.color_active = BLUE
 
@@ -112,11 +197,18 @@ class InputBox(UIComponent):
         display_text = self.text if self.text else self.placeholder
         text_color = BLACK if self.text else DARK_GRAY
 
-        text_surface = self.font.render(display_text, True, text_color)
+        text_surface = render_text(self.font, display_text, True, text_color)
         surface.blit(text_surface, (self.rect.x + 10, self.rect.y + 10))
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse click and keyboard input."""
+        text, active = self.text, self.active
+        consumed = self._handle_input(event)
+        if self.text != text or self.active != active:
+            self.dirty = True
+        return consumed
+
+    def _handle_input(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.active = self.rect.collidepoint(event.pos)
             return self.active
@@ -141,12 +233,148 @@ class InputBox(UIComponent):
     def clear(self) -> None:
         """Clear the input text."""
         self.text = ""
+        self.dirty = True
 
     def get_text(self) -> str:
         """Get the current text value."""
         return self.text
 
 
+class VirtualList(UIComponent):
+    """
+    Scrollable list that draws and hit-tests only the rows in view.
+
+    Rows sit at fixed pitch, so the visible range and the row under the
+    mouse are computed arithmetically; per-frame cost depends on the
+    list height, not on how many items it holds. Scrolling eases toward
+    its target over a few frames.
+    """
+
+    SCROLLBAR_WIDTH = 6
+    WHEEL_ROWS = 3
+    EASING = 0.35
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        row_height: int,
+        draw_row: Callable[[pygame.Surface, pygame.Rect, object, int], None],
+        row_gap: int = 0
+    ):
+        super().__init__(x, y, w, h)
+        self.row_height = row_height
+        self.pitch = row_height + row_gap
+        self.draw_row = draw_row
+        self.items: Sequence = ()
+        self.scroll = 0.0
+        self.target_scroll = 0.0
+        self.clicked_index: Optional[int] = None
+
+    def set_items(self, items: Sequence) -> None:
+        """Show a sequence (e.g. a list) of items; cheap enough to call every frame."""
+        if items is not self.items:
+            self.items = items
+            self.dirty = True
+        self._clamp()
+
+    @property
+    def max_scroll(self) -> int:
+        return max(0, len(self.items) * self.pitch - self.rect.height)
+
+    @property
+    def animating(self) -> bool:
+        return self.scroll != self.target_scroll
+
+    def _clamp(self) -> None:
+        limit = self.max_scroll
+        if not 0 <= self.target_scroll <= limit:
+            self.target_scroll = min(max(self.target_scroll, 0), limit)
+        if not 0 <= self.scroll <= limit:
+            self.scroll = min(max(self.scroll, 0), limit)
+            self.dirty = True
+
+    def visible_range(self) -> range:
+        """Indexes of the items at least partly in view."""
+        first = int(self.scroll // self.pitch)
+        last = int((self.scroll + self.rect.height) // self.pitch) + 1
+        return range(first, min(last, len(self.items)))
+
+    def row_rect(self, index: int) -> pygame.Rect:
+        """Screen rect of a row at the current scroll position."""
+        top = self.rect.y + index * self.pitch - int(self.scroll)
+        return pygame.Rect(self.rect.x, top, self.rect.width - self.SCROLLBAR_WIDTH - 4, self.row_height)
+
+    def index_at(self, pos) -> Optional[int]:
+        """Index of the row under a screen position, or None."""
+        if not self.rect.collidepoint(pos):
+            return None
+        offset = pos[1] - self.rect.y + int(self.scroll)
+        index, within = divmod(offset, self.pitch)
+        if within >= self.row_height or index >= len(self.items):
+            return None
+        return index
+
+    def scroll_by(self, pixels: float) -> None:
+        """Move the scroll target; the view eases toward it in update()."""
+        self.target_scroll += pixels
+        self._clamp()
+
+    def scroll_to_end(self) -> None:
+        self.target_scroll = self.max_scroll
+
+    def update(self) -> None:
+        """Advance smooth scrolling by one frame."""
+        if not self.animating:
+            return
+        step = (self.target_scroll - self.scroll) * self.EASING
+        if abs(step) < 0.5:
+            self.scroll = self.target_scroll
+        else:
+            self.scroll += step
+        self.dirty = True
+
+    @safe_draw
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the visible rows and, when the list overflows, a scrollbar."""
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect.clip(previous_clip))
+        try:
+            for index in self.visible_range():
+                self.draw_row(surface, self.row_rect(index), self.items[index], index)
+
+            content_height = len(self.items) * self.pitch
+            if content_height > self.rect.height:
+                bar_height = max(20, self.rect.height * self.rect.height // content_height)
+                bar_top = self.rect.y + int(
+                    (self.rect.height - bar_height) * self.scroll / self.max_scroll
+                )
+                bar = pygame.Rect(
+                    self.rect.right - self.SCROLLBAR_WIDTH, bar_top,
+                    self.SCROLLBAR_WIDTH, bar_height
+                )
+                pygame.draw.rect(surface, GRAY, bar, border_radius=3)
+        finally:
+            surface.set_clip(previous_clip)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Handle mouse wheel scrolling and row clicks.
+
+        Returns:
+            True if a row was clicked; its index is in clicked_index
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            if self.rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll_by(-event.y * self.WHEEL_ROWS * self.pitch)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.clicked_index = self.index_at(event.pos)
+            return self.clicked_index is not None
+        return False
+
+
 class Label:
     """Simple text label component."""
     
@@ -162,12 +390,12 @@ class Label:
         self.y = y
         self.text = text
         self.color = color
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
 
     @safe_draw
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the label text."""
-        text_surface = self.font.render(self.text, True, self.color)
+        text_surface = render_text(self.font, self.text, True, self.color)
         surface.blit(text_surface, (self.x, self.y))
 
     def set_text(self, text: str) -> None:
@@ -9,7 +9,7 @@ from contextlib import contextmanager
 # Import from local modules - using try/except for better error messages
 try:
     from constants import (
-        WINDOW_WIDTH, WINDOW_HEIGHT, FPS,
+        WINDOW_WIDTH, WINDOW_HEIGHT, FPS, IDLE_WAIT_MS,
         WHITE, BLACK, GRAY, LIGHT_GRAY, DARK_GRAY,
         BLUE, LIGHT_BLUE, GREEN, RED,
         STATE_MENU, STATE_ADD_DISHES, STATE_ADD_PEOPLE,
@@ -22,7 +22,7 @@ except ImportError as e:
     raise
 
 try:
-    from ui_components import Button, InputBox, safe_draw
+    from ui_components import Button, InputBox, VirtualList, get_font, render_text, safe_draw
 except ImportError as e:
     print(f"ERROR: Cannot import ui_components.py")
     print(f"Make sure ui_components.py is in the same folder as this file.")
@@ -53,19 +53,55 @@ except ImportError as e:
     print(f"Error details: {e}")
     raise
 
+try:
+    from bill_archive import BillArchive
+except ImportError as e:
+    print(f"ERROR: Cannot import bill_archive.py")
+    print(f"Make sure bill_archive.py is in the same folder as this file.")
+    print(f"Error details: {e}")
+    raise
+
+try:
+    from background_writer import BackgroundWriter
+except ImportError as e:
+    print(f"ERROR: Cannot import background_writer.py")
+    print(f"Make sure background_writer.py is in the same folder as this file.")
+    print(f"Error details: {e}")
+    raise
+
+
+# Events that only reach components; anything else (expose, focus, resize) repaints everything
+INPUT_EVENTS = (
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.MOUSEWHEEL
+)
+
 
 @contextmanager
-def rendering_context(surface: pygame.Surface, color=None):
-    """Context manager for safe rendering operations."""
+def rendering_context(surface: pygame.Surface, color=None, dirty_rects=None):
+    """
+    Context manager for safe rendering operations.
+
+    With dirty_rects, drawing is clipped to those regions and only they
+    are pushed with pygame.display.update; otherwise the whole screen
+    is repainted and flipped.
+    """
     if color is None:
         color = WHITE
     try:
+        if dirty_rects:
+            surface.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
         surface.fill(color)
         yield surface
-        pygame.display.flip()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
     except Exception as e:
         print(f"Rendering error: {e}")
         raise
+    finally:
+        surface.set_clip(None)
 
 
 class UIManager:
@@ -77,17 +113,22 @@ class UIManager:
         self.clock = pygame.time.Clock()
         self.running = True
 
-        # Initialize fonts
-        self.title_font = pygame.font.Font(None, 56)
-        self.header_font = pygame.font.Font(None, 42)
-        self.normal_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
+        # Initialize fonts (shared through the font registry)
+        self.title_font = get_font(56)
+        self.header_font = get_font(42)
+        self.normal_font = get_font(32)
+        self.small_font = get_font(24)
 
         # Initialize components
         self.input_collector = InputCollector()
         self.state = STATE_MENU
         self.saved_filename = None
-        self.dish_rects = {}
+        # Opened on first save, so an unwritable archive never blocks startup
+        self.archive = None
+        self.writer = BackgroundWriter()
+        self.saving = False
+        self.needs_redraw = True
+        self.dirty_rects = []
 
         self._setup_ui_components()
 
@@ -107,14 +148,27 @@ class UIManager:
         self.calculate_button = Button(300, 600, 300, 60, "Calculate Bills", GREEN)
         self.restart_button = Button(300, 600, 300, 60, "Start Over", BLUE)
 
+        # Scrollable lists
+        self.dish_list = VirtualList(50, 330, 800, 260, 35, self._draw_dish_entry)
+        self.people_list = VirtualList(50, 330, 800, 260, 35, self._draw_person_entry)
+        self.assign_list = VirtualList(50, 170, 800, 420, 40, self._draw_assign_row, row_gap=10)
+        self.lists = [self.dish_list, self.people_list, self.assign_list]
+
+        self.components = [
+            self.dish_name_input, self.dish_price_input, self.person_name_input,
+            self.start_button, self.add_dish_button, self.add_person_button,
+            self.next_button, self.back_button, self.calculate_button,
+            self.restart_button
+        ] + self.lists
+
     @safe_draw
     def _draw_menu_screen(self):
         """Draw the main menu screen."""
-        title = self.title_font.render("Bill Splitter", True, BLUE)
+        title = render_text(self.title_font, "Bill Splitter", True, BLUE)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
 
-        subtitle = self.normal_font.render("Split your restaurant bill fairly", True, DARK_GRAY)
+        subtitle = render_text(self.normal_font, "Split your restaurant bill fairly", True, DARK_GRAY)
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 220))
         self.screen.blit(subtitle, subtitle_rect)
 
@@ -128,7 +182,7 @@ class UIManager:
         ]
         y = 400
         for instruction in instructions:
-            text = self.normal_font.render(instruction, True, BLACK)
+            text = render_text(self.normal_font, instruction, True, BLACK)
             rect = text.get_rect(center=(WINDOW_WIDTH // 2, y))
             self.screen.blit(text, rect)
             y += 40
@@ -136,10 +190,10 @@ class UIManager:
     @safe_draw
     def _draw_add_dishes_screen(self):
         """Draw the add dishes screen."""
-        header = self.header_font.render("Add Dishes", True, BLUE)
+        header = render_text(self.header_font, "Add Dishes", True, BLUE)
         self.screen.blit(header, (50, 50))
 
-        instruction = self.small_font.render("Enter dish name & price", True, DARK_GRAY)
+        instruction = render_text(self.small_font, "Enter dish name & price", True, DARK_GRAY)
         self.screen.blit(instruction, (50, 120))
 
         self.dish_name_input.draw(self.screen)
@@ -148,18 +202,16 @@ class UIManager:
 
         # Display added dishes
         y = 280
-        dishes_header = self.normal_font.render(
+        dishes_header = render_text(
+            self.normal_font,
             f"Dishes ({len(self.input_collector.dishes)}):", 
             True, 
             BLACK
         )
         self.screen.blit(dishes_header, (50, y))
 
-        y += 50
-        for dish in list(self.input_collector.dishes.values())[:8]:
-            dish_text = self.small_font.render(f"• {dish.get_info()}", True, BLACK)
-            self.screen.blit(dish_text, (70, y))
-            y += 35
+        self.dish_list.set_items(self.input_collector.dish_names)
+        self.dish_list.draw(self.screen)
 
         self.next_button.draw(self.screen)
         self.back_button.draw(self.screen)
@@ -167,10 +219,10 @@ class UIManager:
     @safe_draw
     def _draw_add_people_screen(self):
         """Draw the add people screen."""
-        header = self.header_font.render("Add People", True, BLUE)
+        header = render_text(self.header_font, "Add People", True, BLUE)
         self.screen.blit(header, (50, 50))
 
-        instruction = self.small_font.render("Enter each person's name", True, DARK_GRAY)
+        instruction = render_text(self.small_font, "Enter each person's name", True, DARK_GRAY)
         self.screen.blit(instruction, (50, 120))
 
         self.person_name_input.draw(self.screen)
@@ -178,18 +230,16 @@ class UIManager:
 
         # Display added people
         y = 280
-        people_header = self.normal_font.render(
+        people_header = render_text(
+            self.normal_font,
             f"People ({len(self.input_collector.people)}):", 
             True, 
             BLACK
         )
         self.screen.blit(people_header, (50, y))
 
-        y += 50
-        for person in list(self.input_collector.people.values())[:10]:
-            text = self.small_font.render(f"• {person.name}", True, BLACK)
-            self.screen.blit(text, (70, y))
-            y += 35
+        self.people_list.set_items(self.input_collector.people_list)
+        self.people_list.draw(self.screen)
 
         self.next_button.draw(self.screen)
         self.back_button.draw(self.screen)
@@ -197,36 +247,27 @@ class UIManager:
     @safe_draw
     def _draw_assign_orders_screen(self):
         """Draw the dish assignment screen."""
+        if self.saving:
+            saving_text = render_text(self.header_font, "Saving bill...", True, DARK_GRAY)
+            self.screen.blit(saving_text, (50, 50))
+            return
+
         current_person = self.input_collector.get_current_person()
         
         if not current_person:
             return
 
-        header = self.header_font.render(
+        header = render_text(
+            self.header_font,
             f"Map Name and Dish for {current_person.name}", 
             True, 
             BLUE
         )
         self.screen.blit(header, (50, 50))
 
-        # Draw selectable dishes
-        y = 170
-        self.dish_rects = {}
-        
-        for dish in self.input_collector.dishes.values():
-            rect = pygame.Rect(50, y, 800, 40)
-            self.dish_rects[dish.name] = rect
-
-            is_selected = dish.name in self.input_collector.selected_dishes
-            color = LIGHT_BLUE if is_selected else LIGHT_GRAY
-
-            pygame.draw.rect(self.screen, color, rect, border_radius=5)
-            pygame.draw.rect(self.screen, DARK_GRAY, rect, 2, border_radius=5)
-
-            check = "(selected) " if is_selected else "  "
-            text = self.normal_font.render(check + dish.get_info(), True, BLACK)
-            self.screen.blit(text, (60, y + 5))
-            y += 50
+        # Draw selectable dishes (only the rows in view)
+        self.assign_list.set_items(self.input_collector.dish_names)
+        self.assign_list.draw(self.screen)
 
         # Update button text
         self.next_button.text = "Finish" if self.input_collector.is_last_person() else "Next Person"
@@ -234,10 +275,35 @@ class UIManager:
         self.next_button.draw(self.screen)
         self.back_button.draw(self.screen)
 
+    def _draw_dish_entry(self, surface, rect, dish_name, index):
+        """VirtualList row: one dish on the add dishes screen."""
+        dish = self.input_collector.dishes[dish_name]
+        text = render_text(self.small_font, f"• {dish.get_info()}", True, BLACK)
+        surface.blit(text, (rect.x + 20, rect.y))
+
+    def _draw_person_entry(self, surface, rect, person, index):
+        """VirtualList row: one person on the add people screen."""
+        text = render_text(self.small_font, f"• {person.name}", True, BLACK)
+        surface.blit(text, (rect.x + 20, rect.y))
+
+    def _draw_assign_row(self, surface, rect, dish_name, index):
+        """VirtualList row: one selectable dish on the assign orders screen."""
+        dish = self.input_collector.dishes[dish_name]
+        is_selected = self.input_collector.is_dish_selected(dish_name)
+        color = LIGHT_BLUE if is_selected else LIGHT_GRAY
+
+        pygame.draw.rect(surface, color, rect, border_radius=5)
+        pygame.draw.rect(surface, DARK_GRAY, rect, 2, border_radius=5)
+
+        check = "(selected) " if is_selected else "  "
+        text = render_text(self.normal_font, check + dish.get_info(), True, BLACK)
+        surface.blit(text, (rect.x + 10, rect.y + 5))
+
     @safe_draw
     def _draw_file_saved_screen(self):
         """Draw the file saved confirmation screen."""
-        header = self.header_font.render(
+        header = render_text(
+            self.header_font,
             "The result file has been created!", 
             True, 
             GREEN
@@ -250,13 +316,13 @@ class UIManager:
                 info_text = f"File: {self.saved_filename}"
                 path_text = f"Address: {path}" if path else "Address: (unable to determine)"
                 
-                info_surface = self.normal_font.render(info_text, True, BLACK)
-                path_surface = self.small_font.render(path_text, True, DARK_GRAY)
+                info_surface = render_text(self.normal_font, info_text, True, BLACK)
+                path_surface = render_text(self.small_font, path_text, True, DARK_GRAY)
                 
                 self.screen.blit(info_surface, (50, 150))
                 self.screen.blit(path_surface, (50, 200))
             except Exception as e:
-                error_text = self.normal_font.render(f"Error: {e}", True, RED)
+                error_text = render_text(self.normal_font, f"Error: {e}", True, RED)
                 self.screen.blit(error_text, (50, 150))
 
         self.restart_button.draw(self.screen)
@@ -264,13 +330,14 @@ class UIManager:
     @safe_draw
     def _draw_results_screen(self):
         """Draw the results summary screen."""
-        header = self.header_font.render("Bill Summary", True, GREEN)
+        header = render_text(self.header_font, "Bill Summary", True, GREEN)
         self.screen.blit(header, (50, 30))
 
         # Display individual amounts
         y = 100
         for person in self.input_collector.people.values():
-            text = self.normal_font.render(
+            text = render_text(
+                self.normal_font,
                 OutputManager.format_person_summary(person.name, person.total),
                 True,
                 BLACK
@@ -284,7 +351,8 @@ class UIManager:
         pygame.draw.line(self.screen, DARK_GRAY, (50, y), (WINDOW_WIDTH - 50, y), 2)
         y += 30
 
-        total_text = self.header_font.render(
+        total_text = render_text(
+            self.header_font,
             f"Total: {OutputManager.format_currency(total_bill)}", 
             True, 
             BLUE
@@ -292,7 +360,7 @@ class UIManager:
         self.screen.blit(total_text, (50, y))
 
         # Payment reminder
-        reminder = self.normal_font.render("PLEASE PAY NA KRUB", True, RED)
+        reminder = render_text(self.normal_font, "PLEASE PAY NA KRUB", True, RED)
         reminder_rect = reminder.get_rect(center=(WINDOW_WIDTH // 2, 530))
         self.screen.blit(reminder, reminder_rect)
 
@@ -307,6 +375,7 @@ class UIManager:
         """Handle events on the add dishes screen."""
         self.dish_name_input.handle_event(event)
         self.dish_price_input.handle_event(event)
+        self.dish_list.handle_event(event)
         
         if self.add_dish_button.handle_event(event):
             if self.input_collector.add_dish(
@@ -315,6 +384,8 @@ class UIManager:
             ):
                 self.dish_name_input.clear()
                 self.dish_price_input.clear()
+                self.dish_list.set_items(self.input_collector.dish_names)
+                self.dish_list.scroll_to_end()
         
         if self.next_button.handle_event(event) and self.input_collector.has_dishes():
             self.state = STATE_ADD_PEOPLE
@@ -325,43 +396,87 @@ class UIManager:
     def _handle_add_people_events(self, event):
         """Handle events on the add people screen."""
         self.person_name_input.handle_event(event)
+        self.people_list.handle_event(event)
         
         if self.add_person_button.handle_event(event):
             if self.input_collector.add_person(self.person_name_input.get_text()):
                 self.person_name_input.clear()
+                self.people_list.set_items(self.input_collector.people_list)
+                self.people_list.scroll_to_end()
         
         if self.next_button.handle_event(event) and self.input_collector.has_people():
             self.state = STATE_ASSIGN_ORDERS
             self.input_collector.current_person_index = 0
-            self.input_collector.selected_dishes = []
+            self.input_collector.clear_dish_selection()
+            # Assignments are tracked from here so totals are ready when they finish
+            self.input_collector.start_live_totals()
         
         if self.back_button.handle_event(event):
             self.state = STATE_ADD_DISHES
 
     def _handle_assign_orders_events(self, event):
         """Handle events on the assign orders screen."""
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            for dish_name, rect in self.dish_rects.items():
-                if rect.collidepoint(event.pos):
-                    self.input_collector.toggle_dish_selection(dish_name)
+        if self.saving:
+            return
+
+        if self.assign_list.handle_event(event):
+            index = self.assign_list.clicked_index
+            self.input_collector.toggle_dish_selection(self.input_collector.dish_names[index])
+            # Repaint just the toggled row
+            self.dirty_rects.append(self.assign_list.row_rect(index).clip(self.assign_list.rect))
 
         if self.next_button.handle_event(event):
             has_more = self.input_collector.advance_to_next_person()
             
             if not has_more:
-                BillCalculator.calculate_bills(
-                    self.input_collector.dishes,
-                    self.input_collector.people
-                )
-                self.saved_filename = OutputManager.save_bill_to_file(
-                    self.input_collector.dishes,
-                    self.input_collector.people
-                )
-                self.state = STATE_FILE_SAVED
+                self.input_collector.start_live_totals().refresh()
+                self._save_bill()
 
         if self.back_button.handle_event(event):
             self.state = STATE_ADD_PEOPLE
 
+    def _save_bill(self):
+        """
+        Queue the calculated bill for saving on the background writer.
+
+        The report is rendered here so the writer only touches the disk;
+        the file saved screen is shown once the write is acknowledged.
+        """
+        dishes = self.input_collector.dishes
+        people = self.input_collector.people
+        text = OutputManager.render_bill(dishes, people)
+        filename = OutputManager.generate_filename()
+        person_amounts, total_bill = BillCalculator.get_bill_summary(dishes, people)
+        dish_list = list(dishes.values())
+
+        self.saving = True
+        self.writer.submit(
+            lambda: OutputManager.save_text_to_file(text, filename, exclusive=True),
+            self._on_bill_saved
+        )
+        self.writer.submit(
+            lambda: self._archive_bill(person_amounts, total_bill, dish_list)
+        )
+
+    def _on_bill_saved(self, filename):
+        """Writer callback: show the file saved screen."""
+        self.saving = False
+        self.saved_filename = filename
+        self.state = STATE_FILE_SAVED
+
+    def _archive_bill(self, person_amounts, total_bill, dishes):
+        """
+        Append the calculated bill to the binary bill archive (writer thread).
+
+        If the archive cannot be opened, the bill is kept as a text file only.
+        """
+        try:
+            if self.archive is None:
+                self.archive = BillArchive()
+            self.archive.append(person_amounts, total_bill, dishes)
+        except OSError as e:
+            print(f"Error archiving bill: {e}")
+
     def _handle_results_events(self, event):
         """Handle events on the results screens."""
         if self.restart_button.handle_event(event):
@@ -369,9 +484,48 @@ class UIManager:
             self.state = STATE_MENU
             self.saved_filename = None
 
-    def handle_events(self):
-        """Main event handling dispatcher."""
-        for event in pygame.event.get():
+    def _view_key(self):
+        """Everything whose change needs a full repaint rather than dirty rects."""
+        collector = self.input_collector
+        return (
+            self.state, len(collector.dishes), len(collector.people),
+            collector.current_person_index, self.saving, self.saved_filename
+        )
+
+    def _take_dirty_rects(self):
+        """Collect and reset the regions to repaint: dirty components and dish rows."""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        for component in self.components:
+            if component.dirty:
+                rects.append(component.rect)
+                component.dirty = False
+        return rects
+
+    def _is_animating(self) -> bool:
+        """Whether the screen must keep updating without input."""
+        return self.saving or any(virtual_list.animating for virtual_list in self.lists)
+
+    def handle_events(self, events=None):
+        """
+        Main event handling dispatcher.
+
+        Args:
+            events: Events to handle. If None, drains the pygame event queue
+
+        Sets needs_redraw when the screen must be fully repainted; smaller
+        changes mark components dirty or add to dirty_rects instead.
+        """
+        if self.writer.poll():
+            self.needs_redraw = True
+
+        if events is None:
+            events = pygame.event.get()
+        view = self._view_key()
+
+        for event in events:
+            if event.type not in INPUT_EVENTS:
+                self.needs_redraw = True
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -386,9 +540,17 @@ class UIManager:
             elif self.state in [STATE_RESULTS, STATE_FILE_SAVED]:
                 self._handle_results_events(event)
 
-    def draw(self):
-        """Main drawing dispatcher."""
-        with rendering_context(self.screen):
+        if self._view_key() != view:
+            self.needs_redraw = True
+
+    def draw(self, dirty_rects=None):
+        """
+        Main drawing dispatcher.
+
+        Args:
+            dirty_rects: Regions to repaint. If None, repaints the whole screen
+        """
+        with rendering_context(self.screen, dirty_rects=dirty_rects):
             if self.state == STATE_MENU:
                 self._draw_menu_screen()
             elif self.state == STATE_ADD_DISHES:
@@ -402,9 +564,44 @@ class UIManager:
             elif self.state == STATE_RESULTS:
                 self._draw_results_screen()
 
+    def _wait_for_events(self):
+        """Block until input arrives or IDLE_WAIT_MS passes, then drain the queue."""
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
     def run(self):
-        """Main application loop."""
-        while self.running:
-            self.handle_events()
-            self.draw()
-            self.clock.tick(FPS)
\ No newline at end of file
+        """
+        Main application loop.
+
+        While idle the loop sleeps in pygame.event.wait and redraws only
+        after input or a state change; while animating it polls at FPS.
+        State changes repaint the whole screen, anything smaller repaints
+        only its dirty rects.
+        """
+        try:
+            while self.running:
+                if self._is_animating():
+                    self.handle_events()
+                else:
+                    self.handle_events(self._wait_for_events())
+
+                for virtual_list in self.lists:
+                    virtual_list.update()
+
+                dirty_rects = self._take_dirty_rects()
+                if self.needs_redraw or self.saving:
+                    self.draw()
+                    self.needs_redraw = False
+                    # Drawing marks lists dirty; the full repaint covers them
+                    self._take_dirty_rects()
+                    self.clock.tick(FPS)
+                elif dirty_rects:
+                    self.draw(dirty_rects)
+                    self.clock.tick(FPS)
+        finally:
+            # Finish queued saves and close the archive even if the loop raised
+            self.writer.close()
+            if self.archive is not None:
+                self.archive.close()
\ No newline at end of file